@@ -6,6 +6,7 @@ import os
 import matplotlib.pyplot as plt
 import pytest
 
+from .follower import TableFollower as TableFollower
 from .interact import interact as interact
 from .table import Table as Table
 
@@ -0,0 +1,159 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+
+from .table import Table
+from .util.util import _columns, _parse, _read_header, _units
+
+
+class TableFollower:
+    """Incremental reader for table files which are still being written.
+
+    OOMMF and mumax3 append rows to the table file while the simulation is
+    running. Instead of parsing the whole file on every poll, ``update``
+    remembers the byte offset of the last complete line and parses only the
+    lines appended since the previous call. A trailing line which has not
+    been completely written yet is left for the next call. Parsed rows are
+    stored in an internal buffer whose capacity is doubled when it is full,
+    so that each call costs time proportional to the number of new rows.
+
+    If the file becomes shorter than the already parsed part (e.g. because a
+    new simulation overwrote it), the follower starts again from the
+    beginning of the file.
+
+    Parameters
+    ----------
+    filename : str
+
+        OOMMF ``.odt`` or mumax3 ``.txt`` file.
+
+    x : str, optional
+
+        Independent variable name. Defaults to ``None``.
+
+    rename : bool, optional
+
+        If ``rename=True``, the column names are renamed with their shorter
+        versions. Defaults to ``True``.
+
+    Examples
+    --------
+    1. Following a table file.
+
+    >>> import os
+    >>> import ubermagtable as ut
+    ...
+    >>> odtfile = os.path.join(os.path.dirname(__file__),
+    ...                        'tests', 'test_sample', 'oommf-old-file1.odt')
+    >>> follower = ut.TableFollower(odtfile, x='t')
+    >>> follower.update()
+    25
+    >>> follower.update()  # no new rows have been written
+    0
+    >>> follower.table.xmax / 1e-12  # in picoseconds
+    24.999...
+
+    """
+
+    def __init__(self, filename, x=None, rename=True):
+        self.filename = filename
+        self.x = x
+        self.rename = rename
+        self.reset()
+
+    def reset(self):
+        """Forget all parsed rows and start from the beginning of the file."""
+        self._offset = None  # offset after the last parsed line
+        self._columns = None
+        self._units = None
+        self._values = None
+        self._n = 0
+
+    def update(self):
+        """Parse lines appended to the file since the last call.
+
+        Returns
+        -------
+        int
+
+            Number of new rows.
+
+        """
+        if self._offset is not None and os.path.getsize(self.filename) < self._offset:
+            self.reset()
+
+        with open(self.filename, "rb") as f:
+            if self._offset is None and not self._read_header(f):
+                return 0
+
+            f.seek(self._offset)
+            chunk = f.read()
+
+        end = chunk.rfind(b"\n") + 1  # exclude incomplete trailing line
+        if end == 0:
+            return 0
+
+        self._offset += end
+        values = _parse(io.BytesIO(chunk[:end]), ncols=len(self._columns))
+        self._append(values)
+
+        return len(values)
+
+    @property
+    def table(self):
+        """Table with all rows parsed so far.
+
+        The data of the returned table is a view of the internal buffer and
+        creating it does not copy any data.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Table object.
+
+        Raises
+        ------
+        RuntimeError
+
+            If the header has not been written to the file yet.
+
+        """
+        if self._columns is None:
+            msg = f"Header of {self.filename=} has not been read yet."
+            raise RuntimeError(msg)
+
+        data = pd.DataFrame(self._values[: self._n], columns=self._columns, copy=False)
+        return Table(data=data, units=dict(self._units), x=self.x)
+
+    def _read_header(self, f):
+        """Read the header if it has already been completely written."""
+        lines = _read_header(f)
+        if not lines or not lines[-1].endswith("\n"):
+            return False
+
+        try:
+            cols = _columns(lines, rename=self.rename)
+            units = _units(lines)
+        except IndexError:  # columns or units line not written yet
+            return False
+
+        self._offset = f.tell()
+        self._columns = cols
+        self._units = dict(zip(cols, units))
+        self._values = np.empty((0, len(cols)), dtype=np.float64)
+
+        return True
+
+    def _append(self, values):
+        """Append rows to the buffer, growing it if necessary."""
+        n = self._n + len(values)
+        if n > len(self._values):
+            buffer = np.empty((max(n, 2 * len(self._values)), len(self._columns)))
+            buffer[: self._n] = self._values[: self._n]
+            self._values = buffer
+
+        self._values[self._n : n] = values
+        self._n = n
@@ -1,4 +1,12 @@
+import concurrent.futures
+import functools
+import json
+import os
+import tempfile
+import zipfile
+
 import ipywidgets
+import matplotlib.colors
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -7,6 +15,23 @@ import ubermagutil.units
 
 import ubermagtable.util as uu
 
+# Number of values in a batch of segments transformed at once by ``Table.psd``.
+psd_batchsize = 2**22
+
+# Number of values in a batch of peak neighbourhoods used by ``Table.peaks``.
+peaks_batchsize = 2**22
+
+# Maximum number of options of ``Table.slider`` if ``steps`` is not passed.
+slider_steps = 1000
+
+_windows = {
+    "hann": np.hanning,
+    "hamming": np.hamming,
+    "blackman": np.blackman,
+    "bartlett": np.bartlett,
+    "boxcar": np.ones,
+}
+
 
 @ts.typesystem(
     data=ts.Typed(expected_type=pd.DataFrame), units=ts.Typed(expected_type=dict)
@@ -59,7 +84,19 @@ class Table:
         self.attributes.setdefault("fourierspace", False)
 
     @classmethod
-    def fromfile(cls, filename, /, x=None, rename=True):
+    def fromfile(
+        cls,
+        filename,
+        /,
+        x=None,
+        rename=True,
+        mmap=False,
+        cache=False,
+        usecols=None,
+        rows=None,
+        x_range=None,
+        dtype=None,
+    ):
         """Reads an OOMMF ``.odt`` or mumax3 ``.txt`` scalar data file and
         returns a ``ubermagtable.Table`` object.
 
@@ -78,6 +115,54 @@ class Table:
             If ``rename=True``, the column names are renamed with their shorter
             versions. Defaults to ``True``.
 
+        mmap : bool, optional
+
+            If ``mmap=True``, the file is memory-mapped and parsed block by
+            block into a preallocated array, so that peak memory usage stays
+            close to the size of the resulting table. Recommended for very
+            large files. Defaults to ``False``.
+
+        cache : bool or str, optional
+
+            If ``cache=True``, the parsed table is stored in a binary format in
+            the default cache directory (see ``ubermagtable.util.cache_path``)
+            and read from there as long as the file's modification time and
+            size do not change. A cache directory can be passed instead of
+            ``True``. After storing a new table, the least recently used
+            tables are removed from the cache directory if their total size
+            exceeds ``ubermagtable.util.cache_maxsize``. Defaults to
+            ``False``.
+
+        usecols : list, optional
+
+            Names of columns to be read. Both renamed (e.g. ``'mx'``) and
+            original (e.g. ``'TimeDriver::mx'``) names can be used. Only the
+            selected columns are converted to floating point numbers, which
+            reduces parsing time and memory for files with many columns. If
+            not specified, all columns are read. Defaults to ``None``.
+
+        rows : slice, optional
+
+            Rows to be read, e.g. ``slice(None, None, 100)`` reads every 100th
+            row. Lines which are not selected are not converted to floating
+            point numbers, so that previews of very long tables can be read
+            quickly. Negative ``step`` is not supported. If not specified, all
+            rows are read. Defaults to ``None``.
+
+        x_range : tuple, optional
+
+            Length-2 tuple ``(xmin, xmax)`` selecting only rows with ``xmin <=
+            x <= xmax``. Either bound can be ``None``. Requires ``x``. If
+            ``rows`` is also passed, it selects from the rows within
+            ``x_range``. Defaults to ``None``.
+
+        dtype : numpy.dtype, optional
+
+            Floating point data type of columns, e.g. ``np.float32`` to halve
+            the memory of large tables. OOMMF counters (e.g. ``iteration``) are
+            then stored as integers (see ``ubermagtable.util.read``). If not
+            specified, all columns are ``float64``. Defaults to ``None``.
+
         Returns
         -------
         ubermagtable.Table
@@ -102,337 +187,2163 @@ class Table:
         ...                        'tests', 'test_sample', 'mumax3-file1.txt')
         >>> table = ut.Table.fromfile(odtfile, x='t')
 
-        """
-        cols = uu.columns(filename, rename=rename)
+        3. Reading a large file using memory mapping.
 
-        return cls(
-            data=pd.DataFrame(uu.data(filename), columns=cols),
-            units=uu.units(filename, rename=rename),
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-new-file5.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t', mmap=True)
+
+        4. Caching the parsed table.
+
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as cachedir:
+        ...     table = ut.Table.fromfile(odtfile, x='t', cache=cachedir)
+        ...     table = ut.Table.fromfile(odtfile, x='t', cache=cachedir)
+
+        5. Reading only time and magnetisation columns.
+
+        >>> table = ut.Table.fromfile(odtfile, x='t', usecols=['t', 'mx', 'my', 'mz'])
+        >>> table.y
+        ['mx', 'my', 'mz']
+
+        6. Reading every 10th row after 1 ns.
+
+        >>> table = ut.Table.fromfile(odtfile, x='t', x_range=(1e-9, None),
+        ...                           rows=slice(None, None, 10))
+
+        7. Reading in single precision.
+
+        >>> import numpy as np
+        >>> table = ut.Table.fromfile(odtfile, x='t', dtype=np.float32)
+        >>> table.data['mx'].dtype
+        dtype('float32')
+
+        """
+        if cache:
+            directory = None if cache is True else cache
+            path = uu.cache_path(
+                filename,
+                directory=directory,
+                rename=rename,
+                usecols=usecols,
+                rows=rows,
+                x_range=x_range,
+                x=x if x_range is not None else None,
+                dtype=None if dtype is None else np.dtype(dtype).str,
+            )
+            try:
+                table = cls.from_cache(path)
+                os.utime(path)  # mark as recently used
+            except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+                pass  # missing, concurrently evicted, or corrupt cached table
+            else:
+                table.x = x
+                return table
+
+        data, units = uu.read(
+            filename,
+            rename=rename,
+            mmap=mmap,
+            usecols=usecols,
+            rows=rows,
             x=x,
+            x_range=x_range,
+            dtype=dtype,
         )
+        table = cls(data=data, units=units, x=x)
 
-    @property
-    def x(self):
-        """Independent variable.
+        if cache:
+            table.to_cache(path)
+            uu.evict_cache(directory=directory)
+
+        return table
+
+    @classmethod
+    def fromfiles(
+        cls, filenames, /, x=None, rename=True, workers=1, stack=False, keys=None
+    ):
+        """Reads multiple OOMMF ``.odt`` or mumax3 ``.txt`` scalar data files.
+
+        This method is useful for loading the results of parameter sweeps
+        (e.g. ``drive-0``, ``drive-1``, ...). If ``workers`` is larger than
+        one, files are parsed in parallel in a pool of worker processes. All
+        returned tables share a common set of columns: if the files have
+        different columns, missing values are ``NaN``.
+
+        If ``stack=True``, a single ``ubermagtable.Table`` is returned
+        instead, in which the data of all files is concatenated in a
+        long-format ``pandas.DataFrame``. Its index has two levels: ``run``,
+        identifying the file (its position in ``filenames`` or the
+        corresponding value in ``keys``), and the row within the file. This
+        allows vectorised analysis across runs, e.g. using
+        ``table.data.groupby('run')``.
+
+        Parameters
+        ----------
+        filenames : list
+
+            OOMMF ``.odt`` or mumax3 ``.txt`` files.
+
+        x : str, optional
+
+            Independent variable name. Defaults to ``None``.
+
+        rename : bool, optional
+
+            If ``rename=True``, the column names are renamed with their shorter
+            versions. Defaults to ``True``.
+
+        workers : int, optional
+
+            Number of worker processes. If ``workers=1`` files are read in the
+            current process and if ``workers=None`` the number of processors
+            is used. Defaults to ``1``.
+
+        stack : bool, optional
+
+            If ``stack=True``, a single stacked table is returned. Defaults to
+            ``False``.
+
+        keys : list, optional
+
+            Values of the ``run`` index level of the stacked table. If not
+            specified, positions of files in ``filenames`` are used. Defaults
+            to ``None``.
 
         Returns
         -------
-        str
+        list or ubermagtable.Table
 
-            Column name.
+            List of table objects or a single stacked table if ``stack=True``.
 
-        """
-        return self._x
+        Examples
+        --------
+        1. Reading multiple files.
 
-    @x.setter
-    def x(self, value):
-        if value in self.data.columns or value is None:
-            self._x = value
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> dirname = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample')
+        >>> odtfiles = [os.path.join(dirname, f'oommf-old-file{i}.odt')
+        ...             for i in [1, 2]]
+        >>> tables = ut.Table.fromfiles(odtfiles, x='t')
+        >>> len(tables)
+        2
+
+        2. Stacking the tables and computing the final ``mz`` of each run.
+
+        >>> table = ut.Table.fromfiles(odtfiles, x='t', stack=True)
+        >>> table.data.groupby('run')['mz'].last()
+        run
+        0   ...
+        1   ...
+        Name: mz, dtype: float64
+
+        """
+        read = functools.partial(uu.read, rename=rename)
+        if workers == 1:
+            results = list(map(read, filenames))
         else:
-            msg = f"Column {value} is not a column in data."
-            raise ValueError(msg)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = len(filenames) // (4 * (workers or os.cpu_count() or 1))
+                results = list(pool.map(read, filenames, chunksize=max(chunksize, 1)))
+
+        # Common columns and units of all files.
+        columns = [data.columns.to_list() for data, _ in results]
+        units = {}
+        for _, file_units in results:
+            for col, unit in file_units.items():
+                units.setdefault(col, unit)
+        if any(cols != columns[0] for cols in columns):
+            # Columns are aligned by their names and occurrences, so that files
+            # with duplicated column names can be read.
+            occurrences = list(
+                dict.fromkeys(k for cols in columns for k in _occurrences(cols))
+            )
+            index = pd.Index(occurrences, tupleize_cols=False)
+            data = [
+                data.set_axis(pd.Index(_occurrences(cols), tupleize_cols=False), axis=1)
+                .reindex(columns=index)
+                .set_axis([name for name, _ in occurrences], axis=1)
+                for cols, (data, _) in zip(columns, results)
+            ]
+        else:
+            data = [data for data, _ in results]
 
-    @property
-    def y(self):
-        """Dependent variable(s).
+        if stack:
+            if keys is None:
+                keys = range(len(data))
+            data = pd.concat(data, keys=keys, names=["run", None])
+            return cls(data=data, units=units, x=x)
 
-        This property returns all data column names that are not specified as
-        independent.
+        return [cls(data=d, units=dict(units), x=x) for d in data]
 
-        Returns
-        -------
-        list
+    @classmethod
+    def iter_chunks(cls, filename, /, chunksize=100_000, x=None, rename=True):
+        """Reads an OOMMF ``.odt`` or mumax3 ``.txt`` scalar data file in
+        chunks and yields ``ubermagtable.Table`` objects.
 
-            Independent variables.
+        Each yielded table contains at most ``chunksize`` consecutive rows of
+        the file and has the same columns and units. Only one chunk is kept
+        in memory at a time, so that reductions over tables larger than the
+        available memory can be computed.
+
+        Parameters
+        ----------
+        filename : str
+
+            OOMMF ``.odt`` or mumax3 ``.txt`` file.
+
+        chunksize : int, optional
+
+            Maximum number of rows in a chunk. Defaults to ``100_000``.
+
+        x : str, optional
+
+            Independent variable name. Defaults to ``None``.
+
+        rename : bool, optional
+
+            If ``rename=True``, the column names are renamed with their shorter
+            versions. Defaults to ``True``.
+
+        Yields
+        ------
+        ubermagtable.Table
+
+            Table object containing a chunk of rows.
 
         Examples
         --------
-        1. Getting data columns.
+        1. Computing the maximum of ``max_dm/dt`` chunk by chunk.
 
         >>> import os
         >>> import ubermagtable as ut
         ...
         >>> odtfile = os.path.join(os.path.dirname(__file__),
         ...                        'tests', 'test_sample',
-        ...                        'oommf-old-file5.odt')
-        >>> table = ut.Table.fromfile(odtfile, x='t')
-        >>> table.y
-        [...]
+        ...                        'oommf-new-file5.odt')
+        >>> chunks = ut.Table.iter_chunks(odtfile, chunksize=100, x='t')
+        >>> max(chunk.data['max_dm/dt'].max().item() for chunk in chunks)
+        605.543...
 
         """
-        return [col for col in self.data.columns if col != self.x]
+        for data, units in uu.read_chunks(filename, chunksize, rename=rename):
+            yield cls(data=data, units=dict(units), x=x)
 
-    @property
-    def dx(self):
-        """Spacing of independent variable."""
-        d = np.diff(self.data[self.x])
-        if np.isclose(np.max(d), np.min(d)):
-            return d[0]
-        else:
-            msg = f"Independent variable {self.x=} spacing is not even."
-            raise ValueError(msg)
+    def to_cache(self, filename):
+        """Writes the table to a binary ``.npz`` file.
 
-    @property
-    def xmax(self):
-        """Maximum value of independent variable.
+        Data columns, units, independent variable and attributes are written
+        to an uncompressed NumPy ``.npz`` file, which can be read much faster
+        than the original table file. The file is written to a temporary file
+        first and then renamed, so that a partially written file is never
+        read. Any missing directories are created.
 
-        Returns
-        -------
-        numbers.Real
+        Parameters
+        ----------
+        filename : str
 
-            Independent variable range.
+            Name of the ``.npz`` file.
 
         Examples
         --------
-        1. Getting independent variable range.
+        1. Writing and reading the table.
 
         >>> import os
+        >>> import tempfile
         >>> import ubermagtable as ut
         ...
         >>> odtfile = os.path.join(os.path.dirname(__file__),
         ...                        'tests', 'test_sample',
         ...                        'oommf-old-file1.odt')
         >>> table = ut.Table.fromfile(odtfile, x='t')
-        >>> table.xmax / 1e-12  # get the results in picoseconds
-        24.999...
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     filename = os.path.join(tmpdir, 'table.npz')
+        ...     table.to_cache(filename)
+        ...     cached_table = ut.Table.from_cache(filename)
+        >>> cached_table.xmax == table.xmax
+        True
 
         """
-        return self.data[self.x].iloc[-1].item()
+        dirname = os.path.dirname(os.path.abspath(filename))
+        os.makedirs(dirname, exist_ok=True)
 
-    def apply(self, func, columns=None, args=(), **kwargs):
-        r"""Apply function.
+        arrays = {
+            f"column{i}": self.data.iloc[:, i].to_numpy()
+            for i in range(len(self.data.columns))
+        }
+        arrays.update((f"index{j}", v) for j, v in enumerate(self._index_levels()))
 
-        ``apply`` takes a function and its arguments along with a list of
-        columns that the function should be applied to.
-        It uses the fuction on all of the values in the chosen columns and
-        returns an ``ubermagtable.Table`` object.
-        This function is based off of `pandas.DataFrame.apply
-        <https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.apply.html>`_.
+        with tempfile.NamedTemporaryFile(dir=dirname, suffix=".tmp", delete=False) as f:
+            np.savez(f, metadata=json.dumps(self._metadata()), **arrays)
+        os.replace(f.name, filename)
 
-        If ``columns`` is not specified, by default the function will be
-        applied to all dependent variable columns i.e. ``Table.y``.
+    @classmethod
+    def from_cache(cls, filename, /, columns=None):
+        """Reads a table written by ``ubermagtable.Table.to_cache``.
 
         Parameters
         ----------
-        func : function
+        filename : str
 
-            Function to apply to selected columns.
+            Name of the ``.npz`` file.
 
         columns : list, optional
 
-            A list of variables to be plotted.  Defaults to ``None``.
-
-        args : turple
-
-            Positional arguments to pass to func in addition to the data.
-
-        **kwargs
-
-            Additional keyword arguments to pass as keywords arguments to func.
+            Columns to be read. If not specified, all columns are read.
+            Defaults to ``None``.
 
         Returns
         -------
         ubermagtable.Table
 
-            Result of applying func to selected columns in the table.
+            Table object.
 
         Examples
         --------
-        1. Applying absolute function to data.
+        1. Writing and reading the table.
 
         >>> import os
+        >>> import tempfile
         >>> import ubermagtable as ut
         ...
         >>> odtfile = os.path.join(os.path.dirname(__file__),
         ...                        'tests', 'test_sample',
         ...                        'oommf-old-file1.odt')
         >>> table = ut.Table.fromfile(odtfile, x='t')
-        >>> new_table = table.apply(np.abs)
-        ...
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     filename = os.path.join(tmpdir, 'table.npz')
+        ...     table.to_cache(filename)
+        ...     cached_table = ut.Table.from_cache(filename)
+        >>> cached_table.units == table.units
+        True
 
         """
-        if columns is None:
-            columns = self.y
+        with np.load(filename, allow_pickle=False) as f:
+            metadata = json.loads(f["metadata"].item())
+            return cls._fromcolumns(
+                metadata, columns, lambda i: f[f"column{i}"], lambda j: f[f"index{j}"]
+            )
 
-        return self.__class__(
-            self.data.apply(
-                lambda x: func(x, *args, **kwargs) if x.name in columns else x
-            ),
-            self.units,
-            x=self.x,
-            attributes=self.attributes,
-        )
+    def to_parquet(self, filename, **kwargs):
+        """Writes the table to an Apache Parquet file.
 
-    def rfft(self, x=None, y=None):
-        """Real Fast Fourier Transform.
+        Units, independent variable and attributes are stored in the file
+        metadata, so that the table can be read back losslessly using
+        ``ubermagtable.Table.from_parquet``. Parquet does not support complex
+        numbers, so complex columns (e.g. of Fourier transformed tables) are
+        stored as pairs of ``<column>.real`` and ``<column>.imag`` columns.
+        Duplicated column names get their position appended.
+        This method requires ``pyarrow``. Any keyword arguments accepted by
+        ``pyarrow.parquet.write_table`` (e.g. ``compression``) can be passed.
 
-        The real fast Fourier transform of columns ``y`` with frequency
-        dependent on ``x``.
+        Parameters
+        ----------
+        filename : str
+
+            Name of the Parquet file.
+
+        Examples
+        --------
+        1. Writing and reading the table.
+
+        >>> import os
+        >>> import tempfile
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-new-file5.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     filename = os.path.join(tmpdir, 'table.parquet')
+        ...     table.to_parquet(filename)
+        ...     mtable = ut.Table.from_parquet(
+        ...         filename, columns=['t', 'mx', 'my', 'mz']
+        ...     )
+        >>> mtable.y
+        ['mx', 'my', 'mz']
+
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        metadata = self._metadata()
+        metadata["parquet_columns"] = []  # names of Parquet columns per column
+        arrays = {}
+        duplicated = self.data.columns.duplicated(keep=False)
+        for i, col in enumerate(self.data.columns):
+            name = f"{col}.{i}" if duplicated[i] else col
+            values = self.data.iloc[:, i].to_numpy()
+            if np.iscomplexobj(values):
+                names = [f"{name}.real", f"{name}.imag"]
+                arrays.update(zip(names, [values.real, values.imag]))
+            else:
+                names = [name]
+                arrays[name] = values
+            metadata["parquet_columns"].append(names)
+        for j, values in enumerate(self._index_levels()):
+            arrays[f"__index_level_{j}__"] = values
+
+        table = pa.table(arrays, metadata={"ubermagtable": json.dumps(metadata)})
+        pq.write_table(table, filename, **kwargs)
+
+    @classmethod
+    def from_parquet(cls, filename, /, columns=None):
+        """Reads a table written by ``ubermagtable.Table.to_parquet``.
+
+        Only the columns passed as ``columns`` are read from the file. This
+        method requires ``pyarrow``.
 
         Parameters
         ----------
-        x : str, optional
+        filename : str
 
-            The independent variable to be Fourier transformed. If not
-            specified ``table.x`` is used. Defaults to ``None``.
+            Name of the Parquet file.
 
-        y : list, optional
+        columns : list, optional
 
-            A list of dependent variables to be Fourier transformed. If not
-            specified all columns in ``table.y`` are Fourier transformed.
+            Columns to be read. If not specified, all columns are read.
             Defaults to ``None``.
 
         Returns
         -------
         ubermagtable.Table
 
-            Result of applying a real Fourier transform to selected columns in
-            the table.
+            Table object.
 
         Examples
         --------
-        1. Applying Fourier transforms to the table.
+        1. Writing and reading the Fourier transformed table.
 
         >>> import os
+        >>> import tempfile
         >>> import ubermagtable as ut
         ...
         >>> odtfile = os.path.join(os.path.dirname(__file__),
         ...                        'tests', 'test_sample',
         ...                        'oommf-new-file5.odt')
-        >>> table = ut.Table.fromfile(odtfile, x='t')
-        >>> fft_table = table.rfft()
-        ...
+        >>> fft_table = ut.Table.fromfile(odtfile, x='t').rfft()
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     filename = os.path.join(tmpdir, 'table.parquet')
+        ...     fft_table.to_parquet(filename)
+        ...     res = ut.Table.from_parquet(filename)
+        >>> res.data.equals(fft_table.data)
+        True
+        >>> res.attributes == fft_table.attributes
+        True
 
         """
-        x = self.x if x is None else x
-
-        if x is None:
-            raise ValueError("No independent variable specified.")
-        elif x not in self.data.columns:
-            msg = f"Independent variable {x=} is not in table."
-            raise ValueError(msg)
+        import pyarrow.parquet as pq
 
-        freqs = np.fft.rfftfreq(self.data[x].size, self.dx)
-        cols = ["f"]
-        units = {"f": "Hz"}
-        data = pd.DataFrame(freqs, columns=cols)
+        metadata = json.loads(pq.read_schema(filename).metadata[b"ubermagtable"])
+        names = metadata.pop("parquet_columns")
 
-        if y is None:
-            y = self.y
+        if columns is None:
+            indices = range(len(names))
+        else:
+            indices = [
+                metadata["columns"].index(col)
+                for col in columns
+                if col in metadata["columns"]
+            ]
+        index_names = [f"__index_level_{j}__" for j in range(_nlevels(metadata))]
+        table = pq.read_table(
+            filename, columns=[n for i in indices for n in names[i]] + index_names
+        )
 
-        for i in y:
-            cols.append(f"ft_{i}")
-            units["ft_" + i] = f"({self.units[i]})^-1"
-            data[cols[-1]] = np.fft.rfft(self.data[i])
+        def read(i):
+            values = [table[name].to_numpy() for name in names[i]]
+            return values[0] if len(values) == 1 else values[0] + 1j * values[1]
 
-        attributes = dict(self.attributes)  # to explicitly copy
-        attributes["realspace_x"] = [
-            np.min(self.data[x]),  # Min
-            np.max(self.data[x]),  # Max
-            self.data[x].size,  # n
-        ]
-        attributes["fourierspace"] = True
-        return self.__class__(data, units, x=cols[0], attributes=attributes)
+        return cls._fromcolumns(
+            metadata, columns, read, lambda j: table[index_names[j]].to_numpy()
+        )
 
-    def irfft(self, x=None, y=None):
-        """Inverse Real Fast Fourier Transform.
+    def to_hdf5(self, filename):
+        """Writes the table to an HDF5 file.
 
-        The inverse real fast Fourier transform of columns :code:`y` with
-        frequency dependent on :code:`x`.
+        Each column is stored as a separate HDF5 dataset and units,
+        independent variable and attributes are stored as an attribute of the
+        root group, so that the table can be read back losslessly using
+        ``ubermagtable.Table.from_hdf5``. This method requires ``tables``
+        (PyTables).
 
         Parameters
         ----------
-        x : str, optional
-
-            The independent variable to be inverse Fourier transformed. If not
-            specified ``table.x`` is used. Defaults to ``None``.
-
-        y : list, optional
-
-            A list of dependent variables to be inverse Fourier transformed. If
-            not specified all columns in ``table.y`` are Fourier transformed.
-            Defaults to ``None``.
-
-        Returns
-        -------
-        ubermagtable.Table
+        filename : str
 
-            Result of applying a inverse real Fourier transform to selected
-            columns in the table.
+            Name of the HDF5 file.
 
         Examples
         --------
-        1. Applying inverse Fourier transforms to the table.
+        1. Writing and reading the table.
 
         >>> import os
+        >>> import tempfile
         >>> import ubermagtable as ut
         ...
         >>> odtfile = os.path.join(os.path.dirname(__file__),
         ...                        'tests', 'test_sample',
         ...                        'oommf-new-file5.odt')
         >>> table = ut.Table.fromfile(odtfile, x='t')
-        >>> ifft_table = table.rfft().irfft()
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     filename = os.path.join(tmpdir, 'table.h5')
+        ...     table.to_hdf5(filename)
+        ...     mtable = ut.Table.from_hdf5(filename, columns=['t', 'mx'])
+        >>> mtable.y
+        ['mx']
+
+        """
+        import tables
+
+        with tables.open_file(filename, mode="w") as f:
+            for i in range(len(self.data.columns)):
+                f.create_array("/", f"column{i}", self.data.iloc[:, i].to_numpy())
+            for j, values in enumerate(self._index_levels()):
+                f.create_array("/", f"index{j}", values)
+            f.root._v_attrs.ubermagtable = json.dumps(self._metadata())
+
+    @classmethod
+    def from_hdf5(cls, filename, /, columns=None):
+        """Reads a table written by ``ubermagtable.Table.to_hdf5``.
+
+        Only the columns passed as ``columns`` are read from the file. This
+        method requires ``tables`` (PyTables).
+
+        Parameters
+        ----------
+        filename : str
+
+            Name of the HDF5 file.
+
+        columns : list, optional
+
+            Columns to be read. If not specified, all columns are read.
+            Defaults to ``None``.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Table object.
+
+        Examples
+        --------
+        1. Writing and reading the Fourier transformed table.
+
+        >>> import os
+        >>> import tempfile
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-new-file5.odt')
+        >>> fft_table = ut.Table.fromfile(odtfile, x='t').rfft()
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     filename = os.path.join(tmpdir, 'table.h5')
+        ...     fft_table.to_hdf5(filename)
+        ...     res = ut.Table.from_hdf5(filename)
+        >>> res.data.equals(fft_table.data)
+        True
+        >>> res.attributes == fft_table.attributes
+        True
+
+        """
+        import tables
+
+        with tables.open_file(filename, mode="r") as f:
+            metadata = json.loads(f.root._v_attrs.ubermagtable)
+            return cls._fromcolumns(
+                metadata,
+                columns,
+                lambda i: f.get_node(f"/column{i}").read(),
+                lambda j: f.get_node(f"/index{j}").read(),
+            )
+
+    def _metadata(self):
+        """Units, independent variable and attributes for writing to files.
+
+        Names of index levels are stored under ``'index'``, which is ``None``
+        for the default index.
+
+        """
+        index = self.data.index
+        default = (
+            isinstance(index, pd.RangeIndex)
+            and index.start == 0
+            and index.step == 1
+            and index.name is None
+        )
+        return {
+            "columns": self.data.columns.to_list(),
+            "units": self.units,
+            "x": self.x,
+            "attributes": self.attributes,
+            "index": None if default else list(index.names),
+        }
+
+    def _index_levels(self):
+        """Values of index levels to be written to files (see ``_metadata``)."""
+        if self._metadata()["index"] is None:
+            return []
+
+        levels = []
+        for j in range(self.data.index.nlevels):
+            values = self.data.index.get_level_values(j).to_numpy()
+            levels.append(values.astype(str) if values.dtype == object else values)
+
+        return levels
+
+    @classmethod
+    def _fromcolumns(cls, metadata, columns, read, read_index):
+        """Table from metadata and functions reading the i-th column and the j-th
+        index level."""
+        if columns is None:
+            columns = metadata["columns"]
+            indices = range(len(columns))
+        elif missing := [col for col in columns if col not in metadata["columns"]]:
+            msg = f"Columns {missing} are not in the file."
+            raise ValueError(msg)
+        else:
+            indices = [metadata["columns"].index(col) for col in columns]
+
+        data = pd.DataFrame({i: read(index) for i, index in enumerate(indices)})
+        data.columns = columns
+        if (names := metadata.get("index")) is not None:
+            levels = [read_index(j) for j in range(len(names))]
+            levels = [v.astype(str) if v.dtype.kind == "S" else v for v in levels]
+            if len(levels) == 1:
+                data.index = pd.Index(levels[0], name=names[0])
+            else:
+                data.index = pd.MultiIndex.from_arrays(levels, names=names)
+
+        return cls(
+            data=data,
+            units={k: v for k, v in metadata["units"].items() if k in columns},
+            x=metadata["x"] if metadata["x"] in columns else None,
+            attributes=metadata["attributes"],
+        )
+
+    @property
+    def x(self):
+        """Independent variable.
+
+        Returns
+        -------
+        str
+
+            Column name.
+
+        """
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        if value in self.data.columns or value is None:
+            self._x = value
+        else:
+            msg = f"Column {value} is not a column in data."
+            raise ValueError(msg)
+
+    @property
+    def y(self):
+        """Dependent variable(s).
+
+        This property returns all data column names that are not specified as
+        independent.
+
+        Returns
+        -------
+        list
+
+            Independent variables.
+
+        Examples
+        --------
+        1. Getting data columns.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-old-file5.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> table.y
+        [...]
+
+        """
+        return [col for col in self.data.columns if col != self.x]
+
+    @property
+    def dx(self):
+        """Spacing of independent variable.
+
+        Raises
+        ------
+        ValueError
+
+            If the spacing is not even.
+
+        """
+        return self._dx(self.x)
+
+    def _dx(self, x):
+        """Spacing of independent variable ``x``."""
+        dx = self._xmetadata(x)["dx"]
+        if dx is None:
+            msg = f"Independent variable {x=} spacing is not even."
+            raise ValueError(msg)
+        return dx
+
+    def _xmetadata(self, x):
+        """Metadata of independent variable ``x``.
+
+        The metadata are computed once per column and cached until ``data``
+        is reassigned. Changes to ``data`` in place are not detected.
+
+        Returns
+        -------
+        dict
+
+            Number of values ``n``, ``first``, ``last``, ``min`` and ``max``
+            values, spacing ``dx`` (``None`` if it is not even), and whether
+            the values are ``monotonic`` (non-decreasing) and strictly
+            ``increasing``.
+
+        """
+        data, cache = getattr(self, "_xcache", (None, None))
+        if data is not self.data:
+            cache = {}
+            self._xcache = (self.data, cache)
+
+        if x not in cache:
+            values = self.data[x].to_numpy()
+            d = np.diff(values)
+            # Values written to table files often have only single precision
+            # (e.g. time in mumax3), so their spacing can vary by the rounding
+            # errors of the largest value.
+            atol = 4 * np.finfo(np.float32).eps * np.abs(values).max() if len(d) else 0
+            uniform = len(d) > 0 and np.isclose(d.max(), d.min(), atol=atol)
+            cache[x] = {
+                "n": len(values),
+                "first": values[0].item() if len(values) else None,
+                "last": values[-1].item() if len(values) else None,
+                "min": values.min().item() if len(values) else None,
+                "max": values.max().item() if len(values) else None,
+                "dx": ((values[-1] - values[0]) / len(d)).item() if uniform else None,
+                "monotonic": bool(np.all(d >= 0)),
+                "increasing": bool(np.all(d > 0)),
+            }
+
+        return cache[x]
+
+    @property
+    def xmax(self):
+        """Maximum value of independent variable.
+
+        Returns
+        -------
+        numbers.Real
+
+            Independent variable range.
+
+        Examples
+        --------
+        1. Getting independent variable range.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-old-file1.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> table.xmax / 1e-12  # get the results in picoseconds
+        24.999...
+
+        """
+        return self._xmetadata(self.x)["last"]
+
+    def apply(
+        self, func, columns=None, args=(), vectorized=None, inplace=False, **kwargs
+    ):
+        r"""Apply function.
+
+        ``apply`` takes a function and its arguments along with a list of
+        columns that the function should be applied to.
+        It uses the fuction on all of the values in the chosen columns and
+        returns an ``ubermagtable.Table`` object.
+        This function is based off of `pandas.DataFrame.apply
+        <https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.apply.html>`_.
+
+        If ``columns`` is not specified, by default the function will be
+        applied to all dependent variable columns i.e. ``Table.y``.
+
+        Vectorised functions (NumPy ufuncs such as ``np.abs`` and functions
+        created with ``np.vectorize``) are called only once with a 2-D array of
+        all selected columns, and columns which are not selected are not
+        copied, if all arguments are scalars and the selected columns have the
+        same data type. Other functions are called for each column
+        (``pandas.Series``) separately. Any other function which operates on a
+        2-D array column by column and returns an array of the same shape can
+        use the fast path by passing ``vectorized=True``.
+
+        Parameters
+        ----------
+        func : function
+
+            Function to apply to selected columns.
+
+        columns : list, optional
+
+            A list of variables to be plotted.  Defaults to ``None``.
+
+        args : turple
+
+            Positional arguments to pass to func in addition to the data.
+
+        vectorized : bool, optional
+
+            If ``vectorized=True``, ``func`` is called once with a 2-D array of
+            all selected columns and if ``vectorized=False``, it is called for
+            each column separately. If not specified, NumPy ufuncs and
+            ``np.vectorize`` functions are treated as vectorised if all
+            arguments are scalars and the selected columns have the same data
+            type. Defaults to ``None``.
+
+        inplace : bool, optional
+
+            If ``inplace=True``, the data of this table is replaced with a new
+            ``pandas.DataFrame`` holding the result and ``None`` is returned,
+            so that DataFrames previously obtained from ``table.data`` are not
+            modified. Defaults to ``False``.
+
+        **kwargs
+
+            Additional keyword arguments to pass as keywords arguments to func.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Result of applying func to selected columns in the table, or
+            ``None`` if ``inplace=True``.
+
+        Raises
+        ------
+        ValueError
+
+            If vectorised ``func`` does not return an array of the same shape.
+
+        Examples
+        --------
+        1. Applying absolute function to data.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-old-file1.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> new_table = table.apply(np.abs)
+        ...
+
+        2. Applying a function in place.
+
+        >>> mx = table.data['mx']
+        >>> table.apply(np.multiply, columns=['mx', 'my', 'mz'], args=(2,),
+        ...             inplace=True)
+        >>> bool((table.data['mx'] == 2 * mx).all())
+        True
+
+        """
+        if columns is None:
+            columns = self.y
+
+        # Columns are selected by their positions to allow duplicated names.
+        positions = [i for i, c in enumerate(self.data.columns) if c in columns]
+        if vectorized is None:
+            vectorized = (
+                isinstance(func, (np.ufunc, np.vectorize))
+                and all(np.ndim(a) == 0 for a in [*args, *kwargs.values()])
+                and self.data.dtypes.iloc[positions].nunique() <= 1
+            )
+
+        if vectorized:
+            values = self.data.iloc[:, positions].to_numpy()
+            result = np.asarray(func(values, *args, **kwargs))
+            if result.shape != values.shape:
+                msg = f"Vectorised {func=} changed the shape of data."
+                raise ValueError(msg)
+
+            # Unselected columns are shared with this table (and not copied)
+            # only if pandas copies them when they are written.
+            data = dict(
+                enumerate(self.data.iloc[:, i] for i in range(self.data.shape[1]))
+            )
+            data.update(zip(positions, result.T))
+            data = pd.DataFrame(data, index=self.data.index, copy=not _copy_on_write())
+            data.columns = self.data.columns
+        else:
+            data = self.data.apply(
+                lambda x: func(x, *args, **kwargs) if x.name in columns else x
+            )
+
+        if inplace:
+            self.data = data
+            return None
+
+        return self.__class__(
+            data,
+            self.units,
+            x=self.x,
+            attributes=self.attributes,
+        )
+
+    def astype(self, dtype):
+        """Convert data types of columns.
+
+        This is useful for reducing the memory of large tables, e.g. by
+        converting them to single precision. Units, the independent variable
+        and attributes are preserved.
+
+        Parameters
+        ----------
+        dtype : numpy.dtype or dict
+
+            Data type of all columns or a dictionary mapping column names to
+            data types.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Table with converted columns.
+
+        Examples
+        --------
+        1. Converting to single precision.
+
+        >>> import os
+        >>> import numpy as np
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-old-file1.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> table.astype(np.float32).data['mx'].dtype
+        dtype('float32')
+
+        2. Converting a single column.
+
+        >>> table.astype({'iteration': int}).data['iteration'].dtype
+        dtype('int64')
+
+        """
+        return self.__class__(
+            self.data.astype(dtype),
+            dict(self.units),
+            x=self.x,
+            attributes=dict(self.attributes),
+        )
+
+    def resample(self, dx=None, x=None, y=None, method="linear"):
+        """Resample onto evenly spaced independent variable.
+
+        Columns ``y`` are interpolated onto values of ``x`` from its minimum
+        to its maximum spaced by ``dx``, so that Fourier analysis (e.g.
+        ``ubermagtable.Table.rfft``) can be applied to the output of evolvers
+        with adaptive steps. All columns are interpolated together in a single
+        vectorised operation. With ``method='linear'``, values are
+        interpolated linearly between neighbouring points and with
+        ``method='cubic'``, a cubic spline is used. Cubic interpolation
+        requires ``scipy``.
+
+        Parameters
+        ----------
+        dx : numbers.Real, optional
+
+            Spacing of the independent variable. If not specified, the mean
+            spacing is used, so that the number of rows does not change.
+            Defaults to ``None``.
+
+        x : str, optional
+
+            The independent variable. It must be strictly increasing. If not
+            specified ``table.x`` is used. Defaults to ``None``.
+
+        y : list, optional
+
+            A list of dependent variables to be resampled. If not specified
+            all columns in ``table.y`` are resampled. Defaults to ``None``.
+
+        method : str, optional
+
+            Either ``'linear'`` or ``'cubic'``. Defaults to ``'linear'``.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Resampled table.
+
+        Raises
+        ------
+        ValueError
+
+            If the arguments are not valid or ``x`` is not strictly
+            increasing.
+
+        Examples
+        --------
+        1. Resampling the table.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-new-file5.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> resampled = table.resample(dx=2e-11)
+        >>> len(resampled.data)
+        250
+        >>> float(resampled.dx) / 1e-12  # in picoseconds
+        20.0...
+
+        """
+        x = self.x if x is None else x
+
+        if x is None:
+            raise ValueError("No independent variable specified.")
+        elif x not in self.data.columns:
+            msg = f"Independent variable {x=} is not in table."
+            raise ValueError(msg)
+
+        if y is None:
+            y = self.y
+
+        xs = self.data[x].to_numpy()
+        if len(xs) < 2 or not self._xmetadata(x)["increasing"]:
+            msg = f"Independent variable {x=} is not strictly increasing."
+            raise ValueError(msg)
+
+        if dx is None:
+            dx = (xs[-1] - xs[0]) / (len(xs) - 1)
+        elif dx <= 0:
+            msg = f"Argument {dx=} must be positive."
+            raise ValueError(msg)
+
+        n = int(np.floor(np.round((xs[-1] - xs[0]) / dx, 9))) + 1
+        grid = xs[0] + np.arange(n) * dx
+        values = self.data[y].to_numpy()
+
+        if method == "linear":
+            i = np.clip(np.searchsorted(xs, grid, side="right"), 1, len(xs) - 1)
+            weights = ((grid - xs[i - 1]) / (xs[i] - xs[i - 1]))[:, np.newaxis]
+            values = values[i - 1] + weights * (values[i] - values[i - 1])
+        elif method == "cubic":
+            import scipy.interpolate
+
+            values = scipy.interpolate.CubicSpline(xs, values, axis=0)(grid)
+        else:
+            msg = f"Unknown interpolation {method=}."
+            raise ValueError(msg)
+
+        data = pd.DataFrame(values, columns=y, copy=False)
+        data.insert(0, x, grid)
+        units = {i: self.units[i] for i in [x, *y]}
+
+        return self.__class__(data, units, x=x, attributes=dict(self.attributes))
+
+    def rfft(
+        self,
+        x=None,
+        y=None,
+        n=None,
+        window=None,
+        detrend=None,
+        representation="complex",
+        dtype=None,
+        backend="numpy",
+        workers=None,
+    ):
+        """Real Fast Fourier Transform.
+
+        The real fast Fourier transform of columns ``y`` with frequency
+        dependent on ``x``. All columns are transformed together in a single
+        call on a two-dimensional array.
+
+        Before the transform, a trend can be subtracted from the columns
+        (``detrend``), they can be multiplied by a ``window`` and zero-padded
+        to ``n`` points. These options are stored in ``attributes['rfft']``
+        together with the subtracted trends, so that
+        ``ubermagtable.Table.irfft`` can undo them and reconstruct the
+        original columns.
+
+        By default, the transform of each column ``<column>`` is stored as a
+        complex column ``'ft_<column>'``. With ``representation='polar'``,
+        it is stored as a pair of real columns ``'amplitude_<column>'`` and
+        ``'phase_<column>'`` instead, so that ``ubermagtable.Table.amplitude``
+        does not need to compute or copy anything. Passing
+        ``dtype=np.complex64`` (or ``np.float32`` for polar representation)
+        halves the memory used by the transform. In both representations,
+        all transformed columns form a single contiguous block of memory.
+
+        Parameters
+        ----------
+        x : str, optional
+
+            The independent variable to be Fourier transformed. If not
+            specified ``table.x`` is used. Defaults to ``None``.
+
+        y : list, optional
+
+            A list of dependent variables to be Fourier transformed. If not
+            specified all columns in ``table.y`` are Fourier transformed.
+            Defaults to ``None``.
+
+        n : int, optional
+
+            Length of the transformed signal. If it is larger than the number
+            of rows, columns are zero-padded, which interpolates the spectrum.
+            It cannot be smaller than the number of rows. If not specified, the
+            number of rows is used. Defaults to ``None``.
+
+        window : str or array_like, optional
+
+            Window applied to the columns. It can be ``'hann'``, ``'hamming'``,
+            ``'blackman'``, ``'bartlett'``, ``'boxcar'`` or an array with one
+            value per row. If not specified, no window is applied. Defaults to
+            ``None``.
+
+        detrend : str, optional
+
+            Trend subtracted from the columns, either ``'constant'`` (mean) or
+            ``'linear'`` (least-squares line). If not specified, no trend is
+            subtracted. Defaults to ``None``.
+
+        representation : str, optional
+
+            Either ``'complex'`` or ``'polar'``. Defaults to ``'complex'``.
+
+        dtype : numpy.dtype, optional
+
+            Data type of the transformed columns, ``np.complex64`` or
+            ``np.complex128`` for ``representation='complex'`` and
+            ``np.float32`` or ``np.float64`` for ``representation='polar'``.
+            If not specified, double precision is used. Other data types raise
+            ``ValueError``. Defaults to ``None``.
+
+        backend : str, optional
+
+            FFT implementation, either ``'numpy'`` (``numpy.fft``) or
+            ``'scipy'`` (``scipy.fft``). Defaults to ``'numpy'``.
+
+        workers : int, optional
+
+            Number of threads used by the ``'scipy'`` backend. Negative values
+            count from the number of CPUs (``-1`` uses all of them). Defaults
+            to ``None``.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Result of applying a real Fourier transform to selected columns in
+            the table.
+
+        Examples
+        --------
+        1. Applying Fourier transforms to the table.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-new-file5.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> fft_table = table.rfft()
+        ...
+
+        2. Zero-padding, detrending and windowing.
+
+        >>> fft_table = table.rfft(n=1000, window='hann', detrend='linear')
+        >>> len(fft_table.data)
+        501
+        >>> fft_table.attributes['rfft']['detrend']
+        'linear'
+
+        3. Storing amplitudes and phases in single precision.
+
+        >>> import numpy as np
+        >>> fft_table = table.rfft(y=['mx'], representation='polar',
+        ...                        dtype=np.float32)
+        >>> fft_table.data.columns.to_list()
+        ['f', 'amplitude_mx', 'phase_mx']
+        >>> fft_table.data['amplitude_mx'].dtype
+        dtype('float32')
+
+        """
+        x = self.x if x is None else x
+
+        if x is None:
+            raise ValueError("No independent variable specified.")
+        elif x not in self.data.columns:
+            msg = f"Independent variable {x=} is not in table."
+            raise ValueError(msg)
+
+        if y is None:
+            y = self.y
+
+        kinds = {"complex": np.complexfloating, "polar": np.floating}
+        if (
+            dtype is not None
+            and representation in kinds
+            and not np.issubdtype(dtype, kinds[representation])
+        ):
+            msg = f"Argument {dtype=} is not supported for {representation=}."
+            raise ValueError(msg)
+
+        values = self.data[y].to_numpy()
+        m = len(values)
+        n = m if n is None else n
+        if n < m:
+            msg = f"Argument {n=} cannot be smaller than the number of rows {m}."
+            raise ValueError(msg)
+
+        trend = _trend(values, detrend)
+        if detrend is not None:
+            values = values - np.arange(m)[:, np.newaxis] * trend[0] - trend[1]
+        if window is not None:
+            values = values * _window(window, m)[:, np.newaxis]
+
+        values = _fft("rfft", values, backend, workers, n=n)
+        units = {"f": "Hz"}
+        if representation == "complex":
+            cols = [f"ft_{i}" for i in y]
+            values = values.astype(dtype or np.complex128, copy=False)
+            units.update({f"ft_{i}": f"({self.units[i]})^-1" for i in y})
+        elif representation == "polar":
+            cols = [f"amplitude_{i}" for i in y] + [f"phase_{i}" for i in y]
+            block = np.empty((len(values), 2 * len(y)), dtype=dtype or np.float64)
+            np.abs(values, out=block[:, : len(y)])
+            np.arctan2(values.imag, values.real, out=block[:, len(y) :])
+            values = block
+            units.update({f"amplitude_{i}": f"({self.units[i]})^-1" for i in y})
+            units.update({f"phase_{i}": "rad" for i in y})
+        else:
+            msg = f"Unknown {representation=}."
+            raise ValueError(msg)
+
+        data = pd.DataFrame(values, columns=cols, copy=False)
+        data.insert(0, "f", np.fft.rfftfreq(n, self._dx(x)))
+
+        attributes = dict(self.attributes)  # to explicitly copy
+        xmetadata = self._xmetadata(x)
+        attributes["realspace_x"] = [xmetadata["min"], xmetadata["max"], xmetadata["n"]]
+        attributes["fourierspace"] = True
+        if window is not None and not isinstance(window, str):
+            window = np.asarray(window).tolist()  # serialisable attributes
+        attributes["rfft"] = {
+            "n": n,
+            "window": window,
+            "detrend": detrend,
+            "trend": dict(zip(y, trend.T.tolist())),  # (slope, intercept)
+            "representation": representation,
+        }
+        return self.__class__(data, units, x="f", attributes=attributes)
+
+    def irfft(self, x=None, y=None, backend="numpy", workers=None):
+        """Inverse Real Fast Fourier Transform.
+
+        The inverse real fast Fourier transform of columns :code:`y` with
+        frequency dependent on :code:`x`. All columns are transformed together
+        in a single call on a two-dimensional array. Zero-padding, window and
+        trend applied by ``ubermagtable.Table.rfft`` are undone, so that the
+        original columns are reconstructed. Where the window vanishes (e.g.
+        the first row for ``window='hann'``), values cannot be reconstructed
+        and they are ``nan``.
+
+        Parameters
+        ----------
+        x : str, optional
+
+            The independent variable to be inverse Fourier transformed. If not
+            specified ``table.x`` is used. Defaults to ``None``.
+
+        y : list, optional
+
+            A list of dependent variables to be inverse Fourier transformed.
+            For polar representation, either amplitude or phase columns can be
+            passed. If not specified all columns in ``table.y`` are Fourier
+            transformed. Defaults to ``None``.
+
+        backend : str, optional
+
+            FFT implementation, either ``'numpy'`` (``numpy.fft``) or
+            ``'scipy'`` (``scipy.fft``). Defaults to ``'numpy'``.
+
+        workers : int, optional
+
+            Number of threads used by the ``'scipy'`` backend. Defaults to
+            ``None``.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Result of applying a inverse real Fourier transform to selected
+            columns in the table.
+
+        Examples
+        --------
+        1. Applying inverse Fourier transforms to the table.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-new-file5.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> ifft_table = table.rfft().irfft()
+        ...
+
+        """
+        if not self.attributes["fourierspace"]:
+            msg = (
+                "Cannot inverse Fourier transform a table which "
+                "has not already been Fourier transformed."
+            )
+            raise RuntimeError(msg)
+        elif "psd" in self.attributes or "stft" in self.attributes:
+            msg = "Only tables created with rfft can be inverse Fourier transformed."
+            raise RuntimeError(msg)
+        elif self._representation not in ["complex", "polar"]:
+            msg = f"Cannot inverse Fourier transform {self._representation} table."
+            raise RuntimeError(msg)
+
+        x = self.x if x is None else x
+
+        if x is None:
+            raise ValueError("No independent variable specified.")
+        elif x not in self.data.columns:
+            msg = f"Independent variable {x=} is not in table."
+            raise ValueError(msg)
+
+        cols = self._transformed(y)
+        m = self.attributes["realspace_x"][2]
+        options = self.attributes.get("rfft", {})
+
+        values = _fft(
+            "irfft", self._spectrum(cols), backend, workers, n=options.get("n", m)
+        )[:m]
+        if options.get("window") is not None:
+            window = _window(options["window"], m)[:, np.newaxis]
+            values = np.divide(
+                values, window, out=np.full_like(values, np.nan), where=window != 0
+            )
+        if options.get("detrend") is not None:
+            trend = np.array([options["trend"][i] for i in cols]).T
+            values += np.arange(m)[:, np.newaxis] * trend[0] + trend[1]
+
+        data = pd.DataFrame(values, columns=cols, copy=False)
+        data.insert(0, "t", np.linspace(*self.attributes["realspace_x"]))
+        units = {"t": "s"}
+        units.update({i: self.units[self._spectrum_columns(i)[0]][1:-4] for i in cols})
+
+        attributes = dict(self.attributes)  # to explicitly copy
+        attributes.pop("rfft", None)
+        attributes["realspace_x"] = None
+        attributes["fourierspace"] = False
+        return self.__class__(data, units, x="t", attributes=attributes)
+
+    def amplitude(self, y=None):
+        """Amplitude of Fourier transform.
+
+        For tables created by ``ubermagtable.Table.rfft`` with
+        ``representation='polar'``, the amplitude columns are selected from
+        this table. With pandas copy-on-write (the default from pandas 3.0),
+        they are shared with this table and not copied until either table is
+        modified; with older pandas they are copied. Otherwise, amplitudes of
+        all columns are computed in a single vectorised call.
+
+        Parameters
+        ----------
+        y : list, optional
+
+            A list of names of the original columns. If not specified, the
+            amplitudes of all transformed columns are returned. Defaults to
+            ``None``.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Fourier-space table with columns ``'amplitude_<column>'``.
+
+        Examples
+        --------
+        1. Amplitude of Fourier transforms.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-new-file5.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> table.rfft(y=['mx', 'my']).amplitude().y
+        ['amplitude_mx', 'amplitude_my']
+
+        """
+        return self._polar("amplitude", np.abs, y)
+
+    def phase(self, y=None):
+        """Phase of Fourier transform.
+
+        For tables created by ``ubermagtable.Table.rfft`` with
+        ``representation='polar'``, the phase columns are selected from this
+        table. With pandas copy-on-write (the default from pandas 3.0), they
+        are shared with this table and not copied until either table is
+        modified; with older pandas they are copied. Otherwise, phases of all
+        columns are computed in a single vectorised call.
+
+        Parameters
+        ----------
+        y : list, optional
+
+            A list of names of the original columns. If not specified, the
+            phases of all transformed columns are returned. Defaults to
+            ``None``.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Fourier-space table with columns ``'phase_<column>'`` in radians.
+
+        Examples
+        --------
+        1. Phase of Fourier transforms.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-new-file5.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> table.rfft(y=['mx', 'my']).phase().units['phase_mx']
+        'rad'
+
+        """
+        return self._polar("phase", np.angle, y)
+
+    def _polar(self, component, func, y):
+        """Table with amplitude or phase columns of Fourier transform."""
+        if (
+            not self.attributes["fourierspace"]
+            or "psd" in self.attributes
+            or "stft" in self.attributes
+            or self._representation not in ["complex", "polar"]
+        ):
+            msg = f"Cannot get {component} of a table not created with rfft."
+            raise ValueError(msg)
+
+        names = self._transformed() if y is None else y
+        cols = [f"{component}_{i}" for i in names]
+        if self._representation == "polar":
+            # Copied by pandas, lazily if copy-on-write is enabled.
+            data = self.data[[self.x, *cols]]
+        else:
+            values = func(self.data[[f"ft_{i}" for i in names]].to_numpy())
+            data = pd.DataFrame(values, columns=cols, copy=False)
+            data.insert(0, self.x, self.data[self.x].to_numpy())
+
+        units = {self.x: self.units[self.x]}
+        for name, col in zip(names, cols):
+            ft_unit = self.units[self._spectrum_columns(name)[0]]
+            units[col] = "rad" if component == "phase" else ft_unit
+
+        attributes = dict(self.attributes)  # to explicitly copy
+        attributes["rfft"] = dict(attributes["rfft"], representation=component)
+        return self.__class__(data, units, x=self.x, attributes=attributes)
+
+    @property
+    def _representation(self):
+        """Representation of Fourier transformed columns."""
+        return self.attributes.get("rfft", {}).get("representation", "complex")
+
+    def _transformed(self, y=None):
+        """Names of original columns of Fourier transformed columns ``y``."""
+        names = {}  # ordered set
+        for col in self.y if y is None else y:
+            for prefix in ["ft_", "amplitude_", "phase_"]:
+                if col.startswith(prefix):
+                    names[col[len(prefix) :]] = None
+                    break
+        return list(names)
+
+    def _spectrum_columns(self, name):
+        """Columns storing the Fourier transform of original column ``name``."""
+        if self._representation == "complex":
+            return [f"ft_{name}"]
+        elif self._representation == "polar":
+            return [f"amplitude_{name}", f"phase_{name}"]
+        else:
+            return [f"{self._representation}_{name}"]
+
+    def _spectrum(self, names):
+        """Complex Fourier transform of original columns ``names``."""
+        if self._representation == "polar":
+            amplitude = self.data[[f"amplitude_{i}" for i in names]].to_numpy()
+            phase = self.data[[f"phase_{i}" for i in names]].to_numpy()
+            return amplitude * np.exp(1j * phase)
+        else:
+            return self.data[[f"ft_{i}" for i in names]].to_numpy()
+
+    def psd(
+        self,
+        x=None,
+        y=None,
+        method="welch",
+        nperseg=256,
+        window="hann",
+        overlap=0.5,
+        backend="numpy",
+        workers=None,
+    ):
+        """Power spectral density.
+
+        The one-sided power spectral density of columns ``y`` with frequency
+        dependent on ``x``. With ``method='welch'``, the signal is split into
+        overlapping segments of ``nperseg`` points, the mean of each segment
+        is subtracted and it is multiplied by ``window`` before the squared
+        magnitudes of their Fourier transforms are averaged. Compared to a
+        single transform of the whole signal, this reduces the noise of the
+        spectrum at the cost of frequency resolution. With
+        ``method='periodogram'``, the whole signal is used as a single
+        segment.
+
+        The segments are views of the data and they are transformed for all
+        columns at once in batches, so that the memory used does not grow
+        with the length of the signal.
+
+        Both ``'welch'`` and ``'periodogram'`` require evenly spaced ``x``.
+        Output of evolvers with adaptive steps can either be resampled using
+        ``ubermagtable.Table.resample`` or analysed directly with
+        ``method='lombscargle'``, which computes the Lomb-Scargle periodogram
+        of the whole signal at the frequencies of a periodogram with the mean
+        spacing of ``x``. For evenly spaced ``x``, it is equal to the
+        periodogram with ``window='boxcar'``. Its cost grows with the product
+        of the numbers of points and frequencies.
+
+        Parameters
+        ----------
+        x : str, optional
+
+            The independent variable. If not specified ``table.x`` is used.
+            Defaults to ``None``.
+
+        y : list, optional
+
+            A list of dependent variables. If not specified, the power spectral
+            density of all columns in ``table.y`` is computed. Defaults to
+            ``None``.
+
+        method : str, optional
+
+            Either ``'welch'``, ``'periodogram'`` or ``'lombscargle'``.
+            Defaults to ``'welch'``.
+
+        nperseg : int, optional
+
+            Number of points in each segment. It is ignored for
+            ``method='periodogram'`` and ``method='lombscargle'``. Defaults to
+            ``256``.
+
+        window : str or array_like, optional
+
+            Window applied to each segment, ignored for
+            ``method='lombscargle'``. It can be ``'hann'``,
+            ``'hamming'``, ``'blackman'``, ``'bartlett'``, ``'boxcar'`` or an
+            array of length ``nperseg``. Defaults to ``'hann'``.
+
+        overlap : float, optional
+
+            Fraction of ``nperseg`` by which neighbouring segments overlap. It
+            must be in ``[0, 1)``. Defaults to ``0.5``.
+
+        backend : str, optional
+
+            FFT implementation, either ``'numpy'`` or ``'scipy'``. Defaults to
+            ``'numpy'``.
+
+        workers : int, optional
+
+            Number of threads used by the ``'scipy'`` backend. Defaults to
+            ``None``.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Fourier-space table with frequency ``'f'`` and power spectral
+            density columns ``'psd_<column>'``.
+
+        Raises
+        ------
+        ValueError
+
+            If the arguments are not valid or the spacing of ``x`` is not even
+            for ``method='welch'`` or ``method='periodogram'``.
+
+        Examples
+        --------
+        1. Power spectral density of the magnetisation.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-new-file5.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> psd_table = table.psd(y=['mx', 'my', 'mz'], nperseg=100)
+        >>> psd_table.data.columns.to_list()
+        ['f', 'psd_mx', 'psd_my', 'psd_mz']
+        >>> len(psd_table.data)
+        51
+
+        """
+        x = self.x if x is None else x
+
+        if x is None:
+            raise ValueError("No independent variable specified.")
+        elif x not in self.data.columns:
+            msg = f"Independent variable {x=} is not in table."
+            raise ValueError(msg)
+
+        if y is None:
+            y = self.y
+
+        n = self.data[x].size
+        if method in ["periodogram", "lombscargle"]:
+            nperseg, overlap = n, 0
+        elif method != "welch":
+            msg = f"Unknown power spectral density {method=}."
+            raise ValueError(msg)
+
+        if not 0 < nperseg <= n:
+            msg = f"Argument {nperseg=} must be positive and at most {n}."
+            raise ValueError(msg)
+        if not 0 <= overlap < 1:
+            msg = f"Argument {overlap=} must be in [0, 1)."
+            raise ValueError(msg)
+
+        step = nperseg - int(nperseg * overlap)
+        if method == "lombscargle":
+            freqs, values = _lombscargle(
+                self.data[x].to_numpy(), self.data[y].to_numpy()
+            )
+            nsegments = 1
+        else:
+            window = _window(window, nperseg)
+            fs = 1 / self._dx(x)
+            segments = np.lib.stride_tricks.sliding_window_view(
+                self.data[y].to_numpy(), nperseg, axis=0
+            )[::step]  # (segment, column, point)
+
+            # Transform the segments in batches to bound the memory.
+            batchsize = max(1, psd_batchsize // (nperseg * max(len(y), 1)))
+            values = np.zeros((nperseg // 2 + 1, len(y)))
+            for start in range(0, len(segments), batchsize):
+                batch = segments[start : start + batchsize]
+                batch = (batch - batch.mean(axis=-1, keepdims=True)) * window
+                spectra = _fft("rfft", batch, backend, workers, axis=-1)
+                values += (np.abs(spectra) ** 2).sum(axis=0).T
+
+            values /= len(segments) * fs * np.sum(window**2)
+            values[1 : (nperseg + 1) // 2] *= 2  # one-sided: no DC and Nyquist
+            freqs = np.fft.rfftfreq(nperseg, 1 / fs)
+            nsegments = len(segments)
+
+        data = pd.DataFrame(values, columns=[f"psd_{i}" for i in y], copy=False)
+        data.insert(0, "f", freqs)
+        units = {"f": "Hz"}
+        units.update({f"psd_{i}": f"({self.units[i]})^2/Hz" for i in y})
+
+        attributes = dict(self.attributes)  # to explicitly copy
+        xmetadata = self._xmetadata(x)
+        attributes["realspace_x"] = [xmetadata["min"], xmetadata["max"], xmetadata["n"]]
+        attributes["fourierspace"] = True
+        attributes["psd"] = {
+            "method": method,
+            "nperseg": nperseg,
+            "noverlap": nperseg - step,
+            "nsegments": nsegments,
+        }
+        return self.__class__(data, units, x="f", attributes=attributes)
+
+    def stft(
+        self,
+        nperseg=256,
+        hop=None,
+        x=None,
+        y=None,
+        window="hann",
+        backend="numpy",
+        workers=None,
+    ):
+        """Short-time Fourier transform.
+
+        The signal is split into frames of ``nperseg`` points, starting every
+        ``hop`` points, and each frame multiplied by ``window`` is real
+        Fourier transformed. The frames are views of the data and all frames
+        of all columns ``y`` are transformed in a single call. As for
+        ``ubermagtable.Table.rfft``, the transforms are not normalised.
+
+        The result is a table in long format with one row per frame and
+        frequency: column ``'t'`` holds the value of ``x`` at the centre of the
+        frame, column ``'f'`` the frequency, and columns ``'stft_<column>'``
+        the complex transforms. Rows are ordered by frame first, so that the
+        values of a column can be reshaped to ``(frames, frequencies)`` given
+        in ``attributes['stft']['shape']``. Because values in both ``'t'`` and
+        ``'f'`` repeat, the independent variable of the result is not set.
+        Spectrograms can be plotted using
+        ``ubermagtable.Table.mpl_spectrogram``.
+
+        Parameters
+        ----------
+        nperseg : int, optional
+
+            Number of points in each frame. Defaults to ``256``.
+
+        hop : int, optional
+
+            Number of points between the starts of neighbouring frames. If not
+            specified, ``nperseg // 2`` is used. Defaults to ``None``.
+
+        x : str, optional
+
+            The independent variable. If not specified ``table.x`` is used.
+            Defaults to ``None``.
+
+        y : list, optional
+
+            A list of dependent variables to be transformed. If not specified
+            all columns in ``table.y`` are transformed. Defaults to ``None``.
+
+        window : str or array_like, optional
+
+            Window applied to each frame. It can be ``'hann'``, ``'hamming'``,
+            ``'blackman'``, ``'bartlett'``, ``'boxcar'`` or an array of length
+            ``nperseg``. Defaults to ``'hann'``.
+
+        backend : str, optional
+
+            FFT implementation, either ``'numpy'`` or ``'scipy'``. Defaults to
+            ``'numpy'``.
+
+        workers : int, optional
+
+            Number of threads used by the ``'scipy'`` backend. Defaults to
+            ``None``.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Short-time Fourier transform of selected columns in the table.
+
+        Raises
+        ------
+        ValueError
+
+            If the arguments are not valid or the spacing of ``x`` is not even.
+
+        Examples
+        --------
+        1. Short-time Fourier transform of the magnetisation.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-new-file5.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> stft_table = table.stft(nperseg=100, hop=50, y=['mx', 'my', 'mz'])
+        >>> stft_table.data.columns.to_list()
+        ['t', 'f', 'stft_mx', 'stft_my', 'stft_mz']
+        >>> stft_table.x is None
+        True
+        >>> stft_table.attributes['stft']['shape']
+        [9, 51]
+
+        """
+        x = self.x if x is None else x
+
+        if x is None:
+            raise ValueError("No independent variable specified.")
+        elif x not in self.data.columns:
+            msg = f"Independent variable {x=} is not in table."
+            raise ValueError(msg)
+
+        if y is None:
+            y = self.y
+
+        hop = nperseg // 2 if hop is None else hop
+        n = self.data[x].size
+        if not 0 < nperseg <= n:
+            msg = f"Argument {nperseg=} must be positive and at most {n}."
+            raise ValueError(msg)
+        if hop < 1:
+            msg = f"Argument {hop=} must be positive."
+            raise ValueError(msg)
+
+        window = _window(window, nperseg)
+        dx = self._dx(x)
+
+        frames = np.lib.stride_tricks.sliding_window_view(
+            self.data[y].to_numpy(), nperseg, axis=0
+        )[::hop]  # (frame, column, point)
+        spectra = _fft("rfft", frames * window, backend, workers, axis=-1)
+        nframes, nfreqs = len(frames), spectra.shape[-1]
+
+        # Long format: one row per frame and frequency, one column per y.
+        values = spectra.transpose(0, 2, 1).reshape(-1, len(y))
+        data = pd.DataFrame(values, columns=[f"stft_{i}" for i in y], copy=False)
+        t = self.data[x].iloc[0] + (np.arange(nframes) * hop + nperseg / 2) * dx
+        data.insert(0, "t", np.repeat(t, nfreqs))
+        data.insert(1, "f", np.tile(np.fft.rfftfreq(nperseg, dx), nframes))
+        units = {"t": self.units[x], "f": "Hz"}
+        units.update({f"stft_{i}": f"({self.units[i]})^-1" for i in y})
+
+        attributes = dict(self.attributes)  # to explicitly copy
+        xmetadata = self._xmetadata(x)
+        attributes["realspace_x"] = [xmetadata["min"], xmetadata["max"], xmetadata["n"]]
+        attributes["fourierspace"] = True
+        attributes["stft"] = {
+            "nperseg": nperseg,
+            "hop": hop,
+            "shape": [nframes, nfreqs],
+        }
+        return self.__class__(data, units, x=None, attributes=attributes)
+
+    def peaks(self, y=None, prominence=None, n=None, wlen=None, refine=True):
+        """Resonance peaks of a Fourier-space table.
+
+        Peaks are local maxima of the magnitude of columns ``y`` of a table
+        created by ``ubermagtable.Table.rfft`` or ``ubermagtable.Table.psd``.
+        The prominence of a peak is its height above the higher of the two
+        minima separating it from higher points of the spectrum (or from its
+        ends) on either side. Its linewidth is the full width at half of its
+        prominence, obtained by linear interpolation. Only peaks with at least
+        ``prominence`` are kept and if ``n`` is passed, only the ``n`` most
+        prominent peaks of each column. If ``refine=True``, the frequency and
+        amplitude of each peak are refined by fitting a parabola through the
+        peak and its neighbours.
+
+        Peaks of all columns are detected at once and their prominences and
+        linewidths are computed in vectorised batches. The search for the
+        bases of a peak can be limited to ``wlen`` points on each side, which
+        makes it faster for long spectra.
+
+        Parameters
+        ----------
+        y : list, optional
+
+            A list of columns. If not specified, all columns in ``table.y``
+            are used. Defaults to ``None``.
+
+        prominence : numbers.Real, optional
+
+            Minimum prominence of peaks. Defaults to ``None``.
+
+        n : int, optional
+
+            Maximum number of peaks per column. Defaults to ``None``.
+
+        wlen : int, optional
+
+            Number of points on each side of a peak searched for its bases. If
+            not specified, the whole spectrum is searched. Defaults to
+            ``None``.
+
+        refine : bool, optional
+
+            If ``refine=True``, parabolic interpolation is used to refine the
+            frequency and amplitude of peaks. Defaults to ``True``.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Table with columns ``'column'``, ``'f'``, ``'amplitude'``,
+            ``'prominence'`` and ``'linewidth'`` and one row per peak. Rows are
+            ordered by column and frequency.
+
+        Raises
+        ------
+        ValueError
+
+            If the table was not created by ``ubermagtable.Table.rfft`` or
+            ``ubermagtable.Table.psd``.
+
+        Examples
+        --------
+        1. Finding the most prominent peaks of the magnetisation spectra.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-new-file5.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> peaks = table.rfft(y=['mx', 'my']).peaks(n=1)
+        >>> peaks.data.columns.to_list()
+        ['column', 'f', 'amplitude', 'prominence', 'linewidth']
+        >>> peaks.data['column'].to_list()
+        ['ft_mx', 'ft_my']
+
+        """
+        if not self.attributes["fourierspace"] or "stft" in self.attributes:
+            msg = "Peaks can only be found in tables created with rfft or psd."
+            raise ValueError(msg)
+
+        if y is None:
+            y = [i for i in self.y if not i.startswith("phase_")]
+
+        f = self.data[self.x].to_numpy()
+        df = f[1] - f[0]
+        values = np.abs(self.data[y].to_numpy())
+
+        rows, cols = _maxima(values)
+
+        prominences, widths = _prominences(values, rows, cols, wlen)
+        widths *= df
+
+        keep = np.ones(len(rows), dtype=bool)
+        if prominence is not None:
+            keep &= prominences >= prominence
+        if n is not None:
+            # Rank of peaks in their column by decreasing prominence.
+            (kept,) = np.nonzero(keep)
+            order = kept[np.lexsort((-prominences[kept], cols[kept]))]
+            rank = np.arange(len(order)) - np.searchsorted(cols[order], cols[order])
+            keep[order[rank >= n]] = False
+
+        (order,) = np.nonzero(keep)
+        order = order[np.lexsort((rows[order], cols[order]))]
+        rows, cols = rows[order], cols[order]
+        frequencies, amplitudes = f[rows], values[rows, cols]
+
+        if refine:
+            left, right = values[rows - 1, cols], values[rows + 1, cols]
+            curvature = left - 2 * amplitudes + right
+            delta = np.divide(
+                left - right,
+                2 * curvature,
+                out=np.zeros_like(curvature),
+                where=curvature < 0,
+            )
+            frequencies = frequencies + delta * df
+            amplitudes = amplitudes - (left - right) * delta / 4
+
+        data = pd.DataFrame(
+            {
+                "column": np.asarray(y, dtype=object)[cols],
+                "f": frequencies,
+                "amplitude": amplitudes,
+                "prominence": prominences[order],
+                "linewidth": widths[order],
+            }
+        )
+        yunits = {self.units[i] for i in y}
+        yunit = yunits.pop() if len(yunits) == 1 else ""
+        units = {
+            "column": "",
+            "f": self.units[self.x],
+            "amplitude": yunit,
+            "prominence": yunit,
+            "linewidth": self.units[self.x],
+        }
+
+        return self.__class__(data, units)
+
+    def __repr__(self):
+        """Representation string.
+
+        Returns
+        -------
+        str
+
+            Representation string.
+
+        Example
+        -------
+        1. Getting representation string.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-old-file3.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='iteration')
+        >>> repr(table)
+        '...
+
+        """
+        return repr(self.data)
+
+    @classmethod
+    def concat(cls, tables, /, shift_x=True):
+        """Merges multiple tables into a single one.
+
+        Data of all tables is concatenated in the given order. If
+        ``shift_x=True``, the last value of the independent variable of all
+        preceding tables is added to the independent variable of each table,
+        so that, e.g., the stages of a multi-stage simulation are merged into
+        one successive table. Offsets are computed before concatenating and
+        each column of the merged table is allocated only once, so that
+        merging ``N`` tables costs time proportional to the total number of
+        rows, unlike chaining ``N - 1`` operations ``<<``. If there are
+        non-matching columns, the missing values will be ``NaN``. Units and
+        attributes are taken from the first table in which they appear.
+
+        Merging is not supported for Fourier transformed tables.
+
+        Parameters
+        ----------
+        tables : list
+
+            List of ``ubermagtable.Table`` objects.
+
+        shift_x : bool, optional
+
+            If ``shift_x=True``, the independent variable is shifted to be
+            successive. Defaults to ``True``.
+
+        Returns
+        -------
+        ubermagtable.Table
+
+            Merged table.
+
+        Raises
+        ------
+        ValueError
+
+            If no tables are passed, if tables have different independent
+            variables, or if ``shift_x=True`` and tables do not have an
+            independent variable.
+
+        Examples
+        --------
+        1. Merging three tables.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> dirname = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample')
+        >>> odtfile1 = os.path.join(dirname, 'oommf-old-file1.odt')
+        >>> odtfile2 = os.path.join(dirname, 'oommf-old-file2.odt')
         ...
+        >>> table1 = ut.Table.fromfile(odtfile1, x='t')
+        >>> table2 = ut.Table.fromfile(odtfile2, x='t')
+        >>> merged_table = ut.Table.concat([table1, table2, table1])
+        >>> merged_table.xmax / 1e-12  # in picoseconds
+        64.99...
 
         """
-        if not self.attributes["fourierspace"]:
-            msg = (
-                "Cannot inverse Fourier transform a table which "
-                "has not already been Fourier transformed."
-            )
-            raise RuntimeError(msg)
+        tables = list(tables)
+        if not tables:
+            raise ValueError("At least one table must be passed.")
 
-        x = self.x if x is None else x
+        if not all(isinstance(table, cls) for table in tables):
+            msg = f"Cannot concatenate objects which are not of type {cls=}."
+            raise TypeError(msg)
 
-        if x is None:
-            raise ValueError("No independent variable specified.")
-        elif x not in self.data.columns:
-            msg = f"Independent variable {x=} is not in table."
+        x = tables[0].x
+        if any(table.x != x for table in tables):
+            msg = f"Independent variable {x=} mismatch."
             raise ValueError(msg)
 
-        t = np.linspace(*self.attributes["realspace_x"])
-        cols = ["t"]
-        units = {"t": "s"}
-        data = pd.DataFrame(t, columns=cols)
-
-        if y is None:
-            y = self.y
-
-        for i in y:
-            cols.append(i[3:])  # remove leading 'ft_'
-            units[i[3:]] = self.units[i][1:-4]  # remove '()^-1'
-            data[cols[-1]] = np.fft.irfft(self.data[i])
+        if shift_x and x is None:
+            raise ValueError("Independent variable must be set to shift it.")
 
-        attributes = dict(self.attributes)  # to explicitly copy
-        attributes["realspace_x"] = None
-        attributes["fourierspace"] = False
-        return self.__class__(data, units, x=cols[0], attributes=attributes)
+        if any(table.attributes["fourierspace"] for table in tables):
+            # Concatenating frequency values as done for the independent
+            # variable generally does not make sense.
+            msg = "Fourier transformed table does not support concatenation."
+            raise RuntimeError(msg)
 
-    def __repr__(self):
-        """Representation string.
+        units = {}
+        attributes = {}
+        for table in tables:
+            for key, value in table.units.items():
+                units.setdefault(key, value)
+            for key, value in table.attributes.items():
+                attributes.setdefault(key, value)
+
+        # Start of each table in the merged table.
+        starts = np.cumsum([0] + [len(table.data) for table in tables])
+
+        if shift_x:
+            lasts = [
+                table.data[x].iloc[-1] if len(table.data) else 0 for table in tables
+            ]
+            offsets = np.cumsum([0] + lasts[:-1])
+
+        # Columns are matched by their names and occurrences, so that tables
+        # with duplicated column names can be merged.
+        positions = [
+            {key: i for i, key in enumerate(_occurrences(table.data.columns))}
+            for table in tables
+        ]
+        keys = list(dict.fromkeys(key for p in positions for key in p))
+        data = {}
+        for key in keys:
+            values = [
+                table.data.iloc[:, p[key]] if key in p else None
+                for table, p in zip(tables, positions)
+            ]
+            dtype = np.result_type(*(v.dtype for v in values if v is not None))
+            if any(v is None for v in values) and not np.issubdtype(dtype, np.inexact):
+                dtype = np.promote_types(dtype, np.float64)  # missing values are NaN
 
-        Returns
-        -------
-        str
+            array = np.empty(starts[-1], dtype=dtype)
+            for start, end, value in zip(starts[:-1], starts[1:], values):
+                array[start:end] = np.nan if value is None else value.to_numpy()
 
-            Representation string.
+            if shift_x and key == (x, 0):
+                array += np.repeat(offsets, np.diff(starts)).astype(dtype)
 
-        Example
-        -------
-        1. Getting representation string.
+            data[len(data)] = array
 
-        >>> import os
-        >>> import ubermagtable as ut
-        ...
-        >>> odtfile = os.path.join(os.path.dirname(__file__),
-        ...                        'tests', 'test_sample',
-        ...                        'oommf-old-file3.odt')
-        >>> table = ut.Table.fromfile(odtfile, x='iteration')
-        >>> repr(table)
-        '...
+        data = pd.DataFrame(data, copy=False)
+        data.columns = [name for name, _ in keys]
 
-        """
-        return repr(self.data)
+        return cls(
+            data=data,
+            units=units,
+            x=x,
+            attributes=attributes,
+        )
 
     def __lshift__(self, other):
         """Merges two tables into a single one.
@@ -443,7 +2354,9 @@ class Table:
         added to the independent variable of the second. If there is no
         independent variable column in second operand's table, no merging is
         allowed and ``ValueError`` is raised. If there are non-matching
-        columns, the missing values will be ``NaN``.
+        columns, the missing values will be ``NaN``. To merge many tables, use
+        ``ubermagtable.Table.concat``, which avoids copying the data
+        repeatedly.
 
         Merging is not supported for Fourier transformed tables.
 
@@ -496,25 +2409,7 @@ class Table:
             )
             raise TypeError(msg)
 
-        if other.x != self.x:
-            msg = f"Independent variable {self.x=} mismatch."
-            raise ValueError(msg)
-
-        if self.attributes["fourierspace"]:
-            # Concatenating frequency values as done for the independent
-            # variable generally does not make sense.
-            msg = "Fourier transformed table does not support operand <<."
-            raise RuntimeError(msg)
-
-        other_df = other.data.copy()  # make a deep copy of dataframe
-        other_df[self.x] += self.data[self.x].iloc[-1]
-
-        return self.__class__(
-            data=pd.concat([self.data, other_df], ignore_index=True),
-            units=self.units,
-            x=self.x,
-            attributes=self.attributes,
-        )
+        return self.concat([self, other])
 
     def mpl(
         self,
@@ -525,6 +2420,7 @@ class Table:
         xlim=None,
         multiplier=None,
         filename=None,
+        decimate=True,
         **kwargs,
     ):
         """Table data plot.
@@ -550,6 +2446,21 @@ class Table:
         plots the data using ``matplotlib.pyplot.plot()`` function, so any
         keyword arguments accepted by it can be passed.
 
+        Tables with many more rows than there are pixels along the horizontal
+        axis are decimated before plotting: rows are split into buckets of
+        consecutive rows, one per pixel, and only the first, last, minimum and
+        maximum rows of each bucket for any of the columns ``y`` are plotted.
+        Therefore, the plot of lines looks the same as the plot of all rows,
+        while the time needed for plotting (and the size of saved files) does
+        not depend on the number of rows. Because most markers would be
+        removed, data plotted with markers (e.g. ``marker='o'``) or without
+        lines (e.g. ``linestyle='none'``) is not decimated by default.
+        Decimation can be switched off by passing ``decimate=False``.
+        Similarly, if ``xlim`` is passed and ``x`` is
+        non-decreasing, only rows within ``xlim`` (and one row on each side)
+        are found by binary search and plotted, so that zooming into a small
+        part of a long table is fast.
+
         Parameters
         ----------
         ax : matplotlib.axes.Axes, optional
@@ -582,6 +2493,13 @@ class Table:
 
             If filename is passed, the plot is saved. Defaults to ``None``.
 
+        decimate : bool or int, optional
+
+            If ``decimate=True``, the number of buckets is the width of ``ax``
+            in pixels, unless markers or no lines are plotted. The number of
+            buckets can also be passed as an integer, which decimates data
+            plotted with markers as well. Defaults to ``True``.
+
         Examples
         --------
         1. Visualising time-dependent data.
@@ -595,6 +2513,10 @@ class Table:
         >>> table = ut.Table.fromfile(odtfile, x='t')
         >>> table.mpl()
 
+        2. Visualising data without decimation.
+
+        >>> table.mpl(decimate=False)
+
         """
         if x is None and self.x is not None:
             x = self.x
@@ -608,18 +2530,17 @@ class Table:
             ax = fig.add_subplot(111)
 
         if multiplier is None:
-            multiplier = ubermagutil.units.si_multiplier(self.xmax)
+            multiplier = self._multiplier(x)
 
         if y is None:
             y = self.y
 
-        for i in y:
-            ax.plot(
-                np.divide(self.data[x].to_numpy(), multiplier),
-                self.data[i],
-                label=i,
-                **kwargs,
-            )
+        if decimate is True:
+            decimate = int(np.ceil(ax.bbox.width)) if _lines_only(kwargs) else None
+
+        xvalues, yvalues = self._plotdata(x, y, xlim, multiplier, decimate)
+        for i, values in zip(y, yvalues):
+            ax.plot(xvalues, values, label=i, **kwargs)
 
         units = f"({ubermagutil.units.rsi_prefixes[multiplier]}{self.units[x]})"
         ax.set_xlabel(f"{x}{units}")
@@ -629,12 +2550,179 @@ class Table:
         ax.legend()
 
         if xlim is not None:
-            plt.xlim(*np.divide(xlim, multiplier))
+            ax.set_xlim(*np.divide(xlim, multiplier))
+
+        if filename is not None:
+            plt.savefig(filename, bbox_inches="tight", pad_inches=0)
+
+    def _plotdata(self, x, y, xlim, multiplier, nbuckets):
+        """Values of ``x`` and columns ``y`` within ``xlim`` to be plotted.
+
+        If ``nbuckets`` is not ``None``, values are decimated to that number of
+        buckets (see ``ubermagtable.Table.mpl``).
+
+        """
+        rows = self._xslice(x, xlim)
+        xvalues = np.divide(self.data[x].to_numpy()[rows], multiplier)
+        yvalues = [self.data[i].to_numpy()[rows] for i in y]
+
+        if nbuckets and yvalues and len(xvalues) > 4 * nbuckets:
+            rows = _decimate(yvalues, nbuckets)
+            xvalues = xvalues[rows]
+            yvalues = [values[rows] for values in yvalues]
+
+        return xvalues, yvalues
+
+    def _multiplier(self, x):
+        """SI multiplier of the largest absolute value of ``x``.
+
+        Values of columns without units (e.g. ``mx`` or ``iteration``) are not
+        scaled.
+
+        """
+        if not self.units.get(x):
+            return 1
+
+        metadata = self._xmetadata(x)
+        return ubermagutil.units.si_multiplier(
+            max(abs(metadata["min"]), abs(metadata["max"]))
+        )
+
+    def _xslice(self, x, xlim, margin=1):
+        """Slice of rows with values of ``x`` within ``xlim``.
+
+        ``margin`` rows are added on each side, so that plotted lines extend
+        to the limits. The limits can be passed in any order (a reversed
+        ``xlim`` inverts the axis). If ``xlim`` is ``None`` or ``x`` is not
+        non-decreasing, all rows are selected.
+
+        """
+        if xlim is None or not self._xmetadata(x)["monotonic"]:
+            return slice(None)
+
+        values = self.data[x].to_numpy()
+        lo, hi = sorted(xlim)
+        start = np.searchsorted(values, lo, side="left") - margin
+        stop = np.searchsorted(values, hi, side="right") + margin
+
+        return slice(max(start, 0), min(stop, len(values)))
+
+    def mpl_spectrogram(
+        self,
+        y=None,
+        ax=None,
+        figsize=None,
+        multiplier=None,
+        log=False,
+        filename=None,
+        **kwargs,
+    ):
+        """Spectrogram plot.
+
+        This method plots the magnitude of a short-time Fourier transform
+        column ``y`` of a table created by ``ubermagtable.Table.stft`` as a
+        function of time (horizontal axis) and frequency (vertical axis). If
+        ``y`` is not passed, the first transformed column is plotted. ``ax``,
+        ``figsize``, ``multiplier`` and ``filename`` have the same meaning as
+        in ``ubermagtable.Table.mpl`` and ``multiplier`` scales the time axis.
+        If ``log=True``, the magnitude is shown on a logarithmic colour scale.
+        This method plots the data using
+        ``matplotlib.pyplot.pcolormesh()`` function, so any keyword arguments
+        accepted by it can be passed.
+
+        Parameters
+        ----------
+        y : str, optional
+
+            Column to be plotted. Defaults to ``None``.
+
+        ax : matplotlib.axes.Axes, optional
+
+            Axes to which the plot is added. Defaults to ``None`` - axes are
+            created internally.
+
+        figsize : tuple, optional
+
+            The size of a created figure if ``ax`` is not passed. Defaults to
+            ``None``.
+
+        multiplier : numbers.Real, optional
+
+            Time axis multiplier.
+
+        log : bool, optional
+
+            If ``log=True``, logarithmic colour scale is used. Defaults to
+            ``False``.
+
+        filename : str, optional
+
+            If filename is passed, the plot is saved. Defaults to ``None``.
+
+        Raises
+        ------
+        ValueError
+
+            If the table was not created by ``ubermagtable.Table.stft`` or
+            ``y`` is not in the table.
+
+        Examples
+        --------
+        1. Visualising the spectrogram.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-new-file5.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> table.stft(nperseg=100, hop=25).mpl_spectrogram('stft_my')
+
+        """
+        if "stft" not in self.attributes:
+            raise ValueError("Table is not a short-time Fourier transform.")
+
+        if y is None:
+            y = next(col for col in self.data.columns if col.startswith("stft_"))
+
+        if y not in self.data.columns:
+            msg = f"Column {y=} is not in table."
+            raise ValueError(msg)
+
+        if ax is None:
+            fig = plt.figure(figsize=figsize)
+            ax = fig.add_subplot(111)
+
+        shape = self.attributes["stft"]["shape"]
+        t = self.data["t"].to_numpy()[:: shape[1]]
+        f = self.data["f"].to_numpy()[: shape[1]]
+        values = np.abs(self.data[y].to_numpy().reshape(shape))
+
+        if multiplier is None:
+            multiplier = ubermagutil.units.si_multiplier(t[-1])
+        fmultiplier = ubermagutil.units.si_multiplier(f[-1])
+
+        if log:
+            kwargs.setdefault("norm", matplotlib.colors.LogNorm())
+
+        mesh = ax.pcolormesh(
+            np.divide(t, multiplier),
+            np.divide(f, fmultiplier),
+            values.T,
+            shading="nearest",
+            **kwargs,
+        )
+        plt.colorbar(mesh, ax=ax, label=f"|{y}|")
+
+        units = f"({ubermagutil.units.rsi_prefixes[multiplier]}{self.units['t']})"
+        ax.set_xlabel(f"t{units}")
+        ax.set_ylabel(f"f({ubermagutil.units.rsi_prefixes[fmultiplier]}Hz)")
 
         if filename is not None:
             plt.savefig(filename, bbox_inches="tight", pad_inches=0)
 
-    def slider(self, x=None, multiplier=None, description=None, **kwargs):
+    def slider(self, x=None, multiplier=None, description=None, steps=None, **kwargs):
         """Slider for interactive plotting.
 
         Based on the values in the independent variable column,
@@ -643,6 +2731,13 @@ class Table:
         ``ipywidgets.SelectionRangeSlider``, so any keyword argument accepted
         by it can be passed.
 
+        Each option of the slider is a row of the table. For long tables,
+        creating an option for every row is slow and makes the widget state
+        large. Therefore, only ``steps`` rows evenly spaced by their indices
+        (always including the first and the last row) are used as options.
+        Option values are the exact values of ``x`` in those rows, so that
+        selected values map back to rows of the table.
+
         Parameters
         ----------
         x : str, optional
@@ -663,6 +2758,13 @@ class Table:
 
             Slider description. Defaults to ``None``.
 
+        steps : int, optional
+
+            Maximum number of slider options. If not specified, all rows are
+            used for tables with at most ``ubermagtable.table.slider_steps``
+            rows and ``slider_steps`` rows are used for longer tables. Defaults
+            to ``None``.
+
         Returns
         -------
         ipywidgets.SelectionRangeSlider
@@ -683,6 +2785,12 @@ class Table:
         >>> table.slider()
         SelectionRangeSlider(...)
 
+        2. Slider with at most 5 options.
+
+        >>> slider = table.slider(steps=5)
+        >>> len(slider.options)
+        5
+
         """
         if x is None and self.x is not None:
             x = self.x
@@ -692,14 +2800,23 @@ class Table:
             raise ValueError(msg)
 
         if multiplier is None:
-            multiplier = ubermagutil.units.si_multiplier(self.xmax)
+            multiplier = self._multiplier(x)
+
+        if steps is None:
+            steps = slider_steps
+        elif steps < 2:
+            msg = f"Argument {steps=} must be at least 2."
+            raise ValueError(msg)
 
-        values = self.data[self.x].to_numpy()
+        values = self.data[x].to_numpy()
+        if len(values) > steps:
+            values = values[np.linspace(0, len(values) - 1, steps).round().astype(int)]
         labels = np.around(values / multiplier, decimals=2).tolist()
         values = values.tolist()
         options = list(zip(labels, values))
 
-        units = f" ({ubermagutil.units.rsi_prefixes[multiplier]}s)" if x == "t" else ""
+        prefix = ubermagutil.units.rsi_prefixes[multiplier]
+        units = f" ({prefix}{self.units[x]})" if self.units.get(x) else ""
         if description is None:
             description = f"{x}{units}:"
 
@@ -762,3 +2879,344 @@ class Table:
             disabled=False,
             **kwargs,
         )
+
+    def interactive_plot(
+        self, x=None, y=None, figsize=None, multiplier=None, decimate=True, **kwargs
+    ):
+        """Interactive plot.
+
+        The plot is controlled by ``ubermagtable.Table.slider`` for choosing the
+        range of the independent variable and ``ubermagtable.Table.selector``
+        for choosing the columns to be plotted. Unlike plotting with
+        ``ubermagtable.Table.mpl`` in a function decorated with
+        ``ubermagtable.interact``, the figure and its lines are created only
+        once. When a widget changes, the data of visible lines is replaced by
+        the rows within the selected range (decimated as in
+        ``ubermagtable.Table.mpl``) and lines of deselected columns are hidden,
+        so that interacting with long tables stays smooth. Widgets are
+        combined using ``ipywidgets.interactive``. The figure is
+        updated in place, which requires an interactive Matplotlib backend,
+        e.g. ``ipympl`` enabled with ``%matplotlib widget`` in Jupyter. Any
+        keyword arguments accepted by ``matplotlib.pyplot.plot()`` can be
+        passed.
+
+        Parameters
+        ----------
+        x : str, optional
+
+            Independent variable. Defaults to ``None``.
+
+        y : list, optional
+
+            A list of variables which can be selected. If not specified, all
+            columns except ``x`` can be selected. Defaults to ``None``.
+
+        figsize : tuple, optional
+
+            The size of the figure. Defaults to ``None``.
+
+        multiplier : numbers.Real, optional
+
+            Independent variable axis multiplier (see
+            ``ubermagtable.Table.mpl``). Defaults to ``None``.
+
+        decimate : bool or int, optional
+
+            Decimation of plotted data (see ``ubermagtable.Table.mpl``).
+            Defaults to ``True``.
+
+        Returns
+        -------
+        ipywidgets.interactive
+
+            Widget with the slider and the selection list.
+
+        Example
+        -------
+        1. Interactive plot.
+
+        >>> import os
+        >>> import ubermagtable as ut
+        ...
+        >>> odtfile = os.path.join(os.path.dirname(__file__),
+        ...                        'tests', 'test_sample',
+        ...                        'oommf-old-file1.odt')
+        >>> table = ut.Table.fromfile(odtfile, x='t')
+        >>> table.interactive_plot()  # doctest: +SKIP
+        interactive(...)
+
+        """
+        if x is None and self.x is not None:
+            x = self.x
+
+        if x not in self.data.columns:
+            msg = f"Independent variable {x=} is not in table."
+            raise ValueError(msg)
+
+        if multiplier is None:
+            multiplier = self._multiplier(x)
+
+        selector = self.selector(x=x)
+        if y is not None:
+            selector.options = selector.value = y
+        columns = list(selector.options)
+
+        fig, ax = plt.subplots(figsize=figsize)
+        lines = dict(zip(columns, ax.plot(*[[] for _ in range(2 * len(columns))])))
+        for column, line in lines.items():
+            line.set(label=column, **kwargs)
+
+        units = f"({ubermagutil.units.rsi_prefixes[multiplier]}{self.units[x]})"
+        ax.set_xlabel(f"{x}{units}")
+        ax.set_ylabel("value")
+        ax.grid(True)
+
+        if decimate is True:
+            decimate = int(np.ceil(ax.bbox.width)) if _lines_only(kwargs) else None
+
+        def update(xlim, y):
+            xvalues, yvalues = self._plotdata(x, y, xlim, multiplier, decimate)
+            for column, line in lines.items():
+                line.set_visible(column in y)
+            for column, values in zip(y, yvalues):
+                lines[column].set_data(xvalues, values)
+
+            ax.set_xlim(*np.divide(xlim, multiplier))
+            ax.relim(visible_only=True)
+            ax.autoscale_view(scalex=False)
+            ax.legend(handles=[lines[column] for column in y])
+            fig.canvas.draw_idle()
+
+        return ipywidgets.interactive(
+            update, xlim=self.slider(x=x, multiplier=multiplier), y=selector
+        )
+
+
+def _nlevels(metadata):
+    """Number of index levels written to a file (see ``Table._metadata``)."""
+    return 0 if metadata.get("index") is None else len(metadata["index"])
+
+
+def _copy_on_write():
+    """Whether pandas copies data shared between objects when it is written."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:  # option not available in pandas<2
+        return False
+
+
+def _occurrences(columns):
+    """Pairs of column names and numbers of their preceding occurrences."""
+    counts = {}
+    occurrences = []
+    for column in columns:
+        occurrences.append((column, counts.get(column, 0)))
+        counts[column] = counts.get(column, 0) + 1
+
+    return occurrences
+
+
+def _fft(func, values, backend, workers, axis=0, n=None):
+    """Apply ``func`` of the FFT ``backend`` along ``axis`` of ``values``."""
+    if backend == "numpy":
+        if workers is not None:
+            msg = f"Argument {workers=} is only supported by the scipy backend."
+            raise ValueError(msg)
+        return getattr(np.fft, func)(values, n=n, axis=axis)
+    elif backend == "scipy":
+        import scipy.fft
+
+        return getattr(scipy.fft, func)(values, n=n, axis=axis, workers=workers)
+    else:
+        msg = f"Unknown FFT {backend=}."
+        raise ValueError(msg)
+
+
+def _lines_only(kwargs):
+    """Whether data is plotted with lines and without markers."""
+    nothing = [None, "", " ", "None", "none"]
+    marker = kwargs.get("marker", plt.rcParams["lines.marker"])
+    linestyle = kwargs.get("linestyle", kwargs.get("ls"))
+    if linestyle is None:
+        linestyle = plt.rcParams["lines.linestyle"]
+
+    return marker in nothing and linestyle not in nothing
+
+
+def _decimate(values, nbuckets):
+    """Rows kept when decimating columns ``values`` to ``nbuckets`` buckets.
+
+    For each bucket of consecutive rows, the first and the last row, and the
+    rows of the minimum and the maximum of each column are kept. NaNs are
+    ignored.
+
+    """
+    n = len(values[0])
+    starts = np.arange(0, n, -(-n // nbuckets))
+    ends = np.append(starts[1:], n) - 1
+    counts = ends - starts + 1
+    rows = np.arange(n)
+
+    keep = [starts, ends]
+    for column in values:
+        for reduce in [np.fmin, np.fmax]:
+            extrema = np.repeat(reduce.reduceat(column, starts), counts)
+            # First row of each bucket equal to the extremum (or the last row
+            # of the bucket if all its values are NaN).
+            first = np.minimum.reduceat(np.where(column == extrema, rows, n), starts)
+            keep.append(np.minimum(first, ends))
+
+    return np.unique(np.concatenate(keep))
+
+
+def _trend(values, detrend):
+    """Slopes and intercepts of trends of columns of ``values`` per row."""
+    if detrend is None:
+        return np.zeros((2, values.shape[1]))
+    elif detrend == "constant":
+        return np.stack([np.zeros(values.shape[1]), values.mean(axis=0)])
+    elif detrend == "linear":
+        return np.polyfit(np.arange(len(values)), values, 1)
+    else:
+        msg = f"Unknown {detrend=}."
+        raise ValueError(msg)
+
+
+def _window(window, n):
+    """Periodic window of length ``n`` given by its name or values."""
+    if isinstance(window, str):
+        if window not in _windows:
+            msg = f"Unknown {window=}."
+            raise ValueError(msg)
+        return _windows[window](n + 1)[:-1]
+
+    window = np.asarray(window, dtype=float)
+    if window.shape != (n,):
+        msg = f"Window must have shape {(n,)}, not {window.shape}."
+        raise ValueError(msg)
+    return window
+
+
+def _lombscargle(t, values):
+    """One-sided Lomb-Scargle power spectral density of columns of ``values``.
+
+    The frequencies are those of a periodogram with the mean spacing of
+    ``t``. The density at zero frequency vanishes because the mean of the
+    columns is subtracted. The frequencies are processed in batches of at most
+    ``psd_batchsize`` values.
+
+    """
+    n = len(t)
+    dt = (t[-1] - t[0]) / (n - 1)
+    t = t - t[0]
+    freqs = np.fft.rfftfreq(n, dt)
+    values = values - values.mean(axis=0)
+
+    psd = np.zeros((len(freqs), values.shape[1]))
+    batchsize = max(1, psd_batchsize // n)
+    for start in range(1, len(freqs), batchsize):
+        wt = 2 * np.pi * freqs[start : start + batchsize, np.newaxis] * t
+        wtau = np.arctan2(np.sin(2 * wt).sum(axis=1), np.cos(2 * wt).sum(axis=1))
+        arg = wt - wtau[:, np.newaxis] / 2
+        for basis in [np.cos(arg), np.sin(arg)]:
+            norm = np.sum(basis**2, axis=1, keepdims=True)
+            # Terms with vanishing norm (e.g. sine at Nyquist frequency) are 0.
+            psd[start : start + batchsize] += np.divide(
+                (basis @ values) ** 2,
+                norm,
+                out=np.zeros((len(basis), values.shape[1])),
+                where=norm > 1e-9 * n,
+            )
+
+    return freqs, psd * dt
+
+
+def _maxima(values):
+    """Row and column indices of local maxima in columns of ``values``.
+
+    As in ``scipy.signal.find_peaks``, a flat maximum (plateau) must be
+    followed by lower points on both sides and it is reported at its middle
+    (rounded down). The columns are searched together by splitting them into
+    runs of equal values.
+
+    """
+    n = len(values)
+    v = values.T.ravel()
+    start = np.ones(v.size, dtype=bool)
+    start[1:] = v[1:] != v[:-1]
+    start[::n] = True  # runs do not continue across columns
+    starts = np.flatnonzero(start)
+    ends = np.append(starts[1:], v.size) - 1
+
+    run = v[starts]
+    maxima = np.zeros(len(starts), dtype=bool)
+    maxima[1:-1] = (run[1:-1] > run[:-2]) & (run[1:-1] > run[2:])
+    maxima &= (starts % n != 0) & (ends % n != n - 1)  # not at column ends
+
+    middle = (starts[maxima] + ends[maxima]) // 2
+    return middle % n, middle // n
+
+
+def _prominences(values, rows, cols, wlen):
+    """Prominences and widths at half prominence of peaks in columns of ``values``.
+
+    The peaks are given by their ``rows`` and ``cols`` indices. The bases of
+    all peaks are first searched within a few points and the window is
+    doubled for the peaks without a higher point on both sides until it
+    reaches ``wlen`` (the whole column if ``None``). This way, the cost is not
+    proportional to the product of the numbers of points and peaks.
+
+    """
+    wlen = len(values) if wlen is None else min(wlen, len(values))
+    # Padding with inf terminates the search for bases at the ends.
+    padded = np.pad(values, ((wlen, wlen), (0, 0)), constant_values=np.inf)
+    prominences = np.empty(len(rows))
+    widths = np.empty(len(rows))
+
+    pending = np.arange(len(rows))
+    w = min(16, wlen)
+    while len(pending):
+        offsets = np.arange(w + 1)
+        batchsize = max(1, peaks_batchsize // (2 * (w + 1)))
+        unresolved = []
+        for start in range(0, len(pending), batchsize):
+            peaks = pending[start : start + batchsize]
+
+            # Points to the left and right of peaks, (peak, side, offset).
+            index = rows[peaks, None, None] + wlen + np.outer([-1, 1], offsets)
+            sides = padded[index, cols[peaks, None, None]]
+            higher = sides > sides[:, :1, :1]
+            found = higher.any(axis=-1)
+
+            # Bases are the minima before the nearest higher points. Searching
+            # further on a side without a higher point can only lower its
+            # base, so the peak is resolved once it is below the other base.
+            stop = np.where(found, higher.argmax(axis=-1), w + 1)
+            before = offsets < stop[..., np.newaxis]
+            bases = np.where(before, sides, np.inf).min(axis=-1)
+            done = (w == wlen) | np.all(
+                found | ((bases <= bases[:, ::-1]) & found[:, ::-1]), axis=-1
+            )
+            unresolved.append(peaks[~done])
+            peaks, sides, before = peaks[done], sides[done], before[done]
+            prominences[peaks] = sides[:, 0, 0] - bases[done].max(axis=-1)
+
+            # Interpolated offsets of the first points below half prominence.
+            level = (sides[:, 0, 0] - prominences[peaks] / 2)[:, None, None]
+            below = np.maximum((before & (sides <= level)).argmax(axis=-1), 1)
+            outer = np.take_along_axis(sides, below[..., np.newaxis], axis=-1)
+            inner = np.take_along_axis(sides, below[..., np.newaxis] - 1, axis=-1)
+            fraction = np.divide(
+                inner - level,
+                inner - outer,
+                out=np.zeros_like(inner),
+                where=inner > outer,
+            )
+            widths[peaks] = (below - 1 + fraction[..., 0]).sum(axis=-1)
+
+        pending = np.concatenate(unresolved)
+        w = min(2 * w, wlen)
+
+    return prominences, widths
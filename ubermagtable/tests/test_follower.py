@@ -0,0 +1,62 @@
+import itertools
+import os
+
+import numpy as np
+import pytest
+
+import ubermagtable as ut
+
+dirname = os.path.join(os.path.dirname(__file__), "test_sample/")
+filenames = ["oommf-old-file1.odt", "oommf-new-file5.odt", "mumax3-file1.txt"]
+odtfiles = [os.path.join(dirname, f) for f in filenames]
+
+
+def test_follower(tmp_path):
+    for odtfile in odtfiles:
+        with open(odtfile, "rb") as f:
+            lines = f.readlines()
+        header = b"".join(itertools.takewhile(lambda s: s.startswith(b"#"), lines))
+        content = b"".join(lines)
+        table = ut.Table.fromfile(odtfile, x="t")
+
+        filename = tmp_path / os.path.basename(odtfile)
+        follower = ut.TableFollower(filename, x="t")
+
+        # Header is written in two steps.
+        filename.write_bytes(header[:15])
+        assert follower.update() == 0
+        with pytest.raises(RuntimeError):
+            _ = follower.table
+
+        filename.write_bytes(header)
+        assert follower.update() == 0
+        assert follower.table.units == table.units
+        assert len(follower.table.data) == 0
+
+        # Data is appended in pieces cut in the middle of lines.
+        written = len(header)
+        for size in range(written + 500, len(content) + 500, 500):
+            with open(filename, "ab") as f:
+                f.write(content[written:size])
+            written = min(size, len(content))
+
+            follower.update()
+            res = follower.table
+            assert isinstance(res, ut.Table)
+            assert res.x == "t"
+            assert res.units == table.units
+            assert np.array_equal(
+                res.data.to_numpy(), table.data.to_numpy()[: len(res.data)]
+            )
+
+        assert follower.update() == 0
+        assert len(follower.table.data) == len(table.data)
+
+        # File is overwritten.
+        filename.write_bytes(content[: len(content) // 2])
+        follower.update()
+        assert 0 < len(follower.table.data) < len(table.data)
+        assert np.array_equal(
+            follower.table.data.to_numpy(),
+            table.data.to_numpy()[: len(follower.table.data)],
+        )
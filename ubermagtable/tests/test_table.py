@@ -85,6 +85,50 @@ class TestTable:
         table = ut.Table.fromfile(self.odtfiles[0], x="t")
         assert abs(table.xmax - 25e-12) < 1e-15
 
+    def test_dx(self):
+        table = ut.Table.fromfile(self.odtfiles[0], x="t")
+        assert np.isclose(table.dx, 1e-12)
+        metadata = table._xmetadata("t")
+        assert metadata["n"] == 25
+        assert metadata["monotonic"] and metadata["increasing"]
+        assert metadata["min"] == metadata["first"]
+        assert metadata["max"] == metadata["last"] == table.xmax
+
+        # Metadata are cached per column.
+        assert table._xmetadata("t") is metadata
+        table.x = "iteration"
+        assert table.dx == 2
+        table.x = "t"
+        assert table._xmetadata("t") is metadata
+
+        # Reassigning data invalidates the cache.
+        data = table.data.copy()
+        data["t"] = np.linspace(0, 1, 25) ** 2
+        table.data = data
+        assert table._xmetadata("t") is not metadata
+        assert table.xmax == 1
+        with pytest.raises(ValueError):
+            table.rfft()
+
+        # Decreasing values.
+        table.data = data.iloc[::-1]
+        assert not table._xmetadata("t")["monotonic"]
+
+        # Single precision values (e.g. time in mumax3 files).
+        for n in [200, 1000, 10000]:
+            t = np.arange(n).astype(np.float32) * np.float32(1e-12)
+            data = pd.DataFrame({"t": t.astype(np.float64), "mx": np.sin(t * 1e11)})
+            table = ut.Table(data, units={"t": "s", "mx": ""}, x="t")
+            assert np.isclose(table.dx, 1e-12)
+            assert len(table.rfft().data) == n // 2 + 1
+
+        # Deviations larger than single precision rounding are not even.
+        k = np.arange(len(data))
+        data["t"] = k * 1e-12 * (1 + 1e-5 * (k % 2))
+        table = ut.Table(data, units={"t": "s", "mx": ""}, x="t")
+        with pytest.raises(ValueError):
+            table.rfft()
+
     def test_lshift(self):
         table1 = ut.Table.fromfile(self.odtfiles[0], x="t")
         table2 = ut.Table.fromfile(self.odtfiles[1], x="t")
@@ -106,6 +150,71 @@ class TestTable:
         with pytest.raises(TypeError):
             res = table3 << 5
 
+    def test_concat(self):
+        table1 = ut.Table.fromfile(self.odtfiles[0], x="t")
+        table2 = ut.Table.fromfile(self.odtfiles[1], x="t")
+        table3 = ut.Table.fromfile(self.odtfiles[15], x="t")  # mumax3
+
+        res = ut.Table.concat([table1, table2, table3])
+        check_table(res)
+        assert res.data.equals((table1 << table2 << table3).data)
+        assert res.xmax == table1.xmax + table2.xmax + table3.xmax
+        assert len(res.data) == len(table1.data) + len(table2.data) + len(table3.data)
+        assert res.units == {**table3.units, **table2.units, **table1.units}
+
+        # Missing values are NaN
+        assert res.data["iteration"].iloc[: len(table1.data)].notna().all()
+        assert (
+            res.data["iteration"]
+            .iloc[len(table1.data) + len(table2.data) :]
+            .isna()
+            .all()
+        )
+
+        res = ut.Table.concat([table1, table2], shift_x=False)
+        assert np.array_equal(
+            res.data["t"], np.concatenate([table1.data["t"], table2.data["t"]])
+        )
+
+        # Integer columns
+        table4 = table1.astype({"iteration": np.int32})
+        res = ut.Table.concat([table4, table4])
+        assert res.data["iteration"].dtype == np.int32
+        res = ut.Table.concat([table4, table3])
+        assert res.data["iteration"].dtype == np.float64
+
+        # Duplicated column names
+        table6 = ut.Table.fromfile(self.odtfiles[-1], x="iteration")
+        assert table6.data.columns.has_duplicates
+        res = table6 << table6
+        expected = pd.concat([table6.data, table6.data], ignore_index=True)
+        expected.iloc[len(table6.data) :, 24] += table6.data["iteration"].iloc[-1]
+        assert res.data.equals(expected)
+
+        table7 = ut.Table.fromfile(self.odtfiles[0], x="iteration")
+        res = ut.Table.concat([table6, table7], shift_x=False)
+        n = len(table6.data)
+        assert res.data.columns.to_list().count("E") == 2
+        assert np.array_equal(res.data.iloc[n:, 1], table7.data["E"])
+        assert res.data.iloc[n:, 13].isna().all()  # second E_MnTaS2
+
+        # Exceptions
+        with pytest.raises(ValueError):
+            ut.Table.concat([])
+
+        table5 = ut.Table.fromfile(self.odtfiles[2], x="iteration")
+        with pytest.raises(ValueError):
+            ut.Table.concat([table1, table5])
+
+        with pytest.raises(ValueError):
+            ut.Table.concat([ut.Table.fromfile(self.odtfiles[0])])
+
+        with pytest.raises(TypeError):
+            ut.Table.concat([table1, 5])
+
+        with pytest.raises(RuntimeError):
+            ut.Table.concat([table1.rfft(), table1.rfft()])
+
     def test_mpl(self):
         table = ut.Table.fromfile(self.odtfiles[0], x="t")
 
@@ -122,6 +231,16 @@ class TestTable:
 
         # x
         table.mpl(x="mx")
+        fig, ax = plt.subplots()
+        table.mpl(ax=ax, x="iteration")
+        assert ax.get_xlabel() == "iteration()"
+        assert ax.lines[0].get_xdata().max() == table.data["iteration"].max()
+
+        table.x = None
+        fig, ax = plt.subplots()
+        table.mpl(ax=ax, x="t", y=["mx"])
+        assert ax.get_xlabel() == "t(ps)"
+        table.x = "t"
 
         # multiplier
         table.mpl(multiplier=1e-6)
@@ -152,6 +271,129 @@ class TestTable:
 
         plt.close("all")
 
+    def test_mpl_decimate(self):
+        rng = np.random.default_rng(0)
+        n = 100_000
+        data = pd.DataFrame(
+            {
+                "t": np.arange(n) * 1e-12,
+                "mx": rng.normal(size=n),
+                "my": np.sin(np.arange(n) / 1000),
+            }
+        )
+        data.loc[10:2000, "mx"] = np.nan
+        table = ut.Table(data, units={"t": "s", "mx": "", "my": ""}, x="t")
+
+        for decimate, nrows in [(False, n), (True, None), (100, 100)]:
+            fig, ax = plt.subplots()
+            table.mpl(ax=ax, decimate=decimate)
+            for line, column in zip(ax.lines, ["mx", "my"]):
+                xdata, ydata = line.get_data()
+                if nrows == n:
+                    assert len(xdata) == n
+                else:
+                    # first, last, min and max of each column in each bucket
+                    nbuckets = nrows or int(np.ceil(ax.bbox.width))
+                    assert len(xdata) <= 6 * nbuckets
+                assert np.all(np.diff(xdata) > 0)
+                assert xdata[0] == 0 and xdata[-1] == table.xmax / 1e-9
+                assert np.nanmin(ydata) == data[column].min()
+                assert np.nanmax(ydata) == data[column].max()
+
+        # Markers or no lines are not decimated by default.
+        for kwargs in [{"marker": "o"}, {"linestyle": "none"}, {"ls": ""}]:
+            fig, ax = plt.subplots()
+            table.mpl(ax=ax, **kwargs)
+            assert all(len(line.get_xdata()) == n for line in ax.lines)
+            plt.close(fig)
+
+        fig, ax = plt.subplots()
+        table.mpl(ax=ax, marker="o", decimate=100)
+        assert all(len(line.get_xdata()) <= 600 for line in ax.lines)
+
+        plt.close("all")
+
+    def test_mpl_xlim(self):
+        table = ut.Table.fromfile(self.odtfiles[0], x="t")
+        t = table.data["t"].to_numpy()
+
+        fig, ax = plt.subplots()
+        table.mpl(ax=ax, xlim=(5e-12, 10e-12), multiplier=1e-12)
+        assert np.allclose(ax.get_xlim(), (5, 10))
+        xdata = ax.lines[0].get_xdata() * 1e-12
+        # rows within xlim with one row on each side
+        inside = (t >= 5e-12) & (t <= 10e-12)
+        assert len(xdata) == inside.sum() + 2
+        assert xdata[0] < 5e-12 < xdata[1]
+        assert xdata[-2] < 10e-12 < xdata[-1]
+
+        # Reversed xlim inverts the axis.
+        fig, ax = plt.subplots()
+        table.mpl(ax=ax, xlim=(20e-12, 5e-12), multiplier=1e-12)
+        assert np.allclose(ax.get_xlim(), (20, 5))
+        inside = (t >= 5e-12) & (t <= 20e-12)
+        assert len(ax.lines[0].get_xdata()) == min(inside.sum() + 2, len(t))
+
+        # xlim outside data
+        fig, ax = plt.subplots()
+        table.mpl(ax=ax, xlim=(1, 2))
+        assert len(ax.lines[0].get_xdata()) == 1
+
+        # Non-monotonic independent variable is not clipped.
+        table = ut.Table.fromfile(self.odtfiles[-5], x="B_hysteresis")
+        fig, ax = plt.subplots()
+        table.mpl(ax=ax, xlim=(0, 0.1))
+        assert len(ax.lines[0].get_xdata()) == len(table.data)
+
+        plt.close("all")
+
+    def test_interactive_plot(self):
+        table = ut.Table.fromfile(self.odtfiles[0], x="t")
+
+        widget = table.interactive_plot(marker="o")
+        assert isinstance(widget, ipywidgets.interactive)
+        slider, selector = widget.children[:2]
+        assert isinstance(slider, ipywidgets.SelectionRangeSlider)
+        assert isinstance(selector, ipywidgets.SelectMultiple)
+
+        fig = plt.gcf()
+        ax = fig.axes[0]
+        lines = list(ax.lines)
+        assert [line.get_label() for line in lines] == list(selector.options)
+        assert all(line.get_visible() for line in lines)
+        assert len(lines[0].get_xdata()) == len(table.data)
+
+        # Lines are updated in place.
+        t = table.data["t"].to_numpy()
+        slider.value = (t[4], t[9])
+        selector.value = ["mx", "my"]
+        assert plt.gcf() is fig
+        assert list(ax.lines) == lines
+        for line in lines:
+            assert line.get_visible() == (line.get_label() in ["mx", "my"])
+        mx = lines[selector.options.index("mx")]
+        assert len(mx.get_xdata()) == 6 + 2  # one row on each side
+        assert np.array_equal(mx.get_ydata(), table.data["mx"].to_numpy()[3:11])
+        assert np.allclose(ax.get_xlim(), (5, 10))
+
+        selector.value = []
+        assert not any(line.get_visible() for line in lines)
+
+        widget = table.interactive_plot(y=["mx", "my", "mz"], decimate=False)
+        assert widget.children[1].options == ("mx", "my", "mz")
+        assert len(plt.gcf().axes[0].lines) == 3
+
+        # Multiplier of a different independent variable
+        table.interactive_plot(x="iteration")
+        ax = plt.gcf().axes[0]
+        assert ax.get_xlabel() == "iteration()"
+        assert ax.lines[0].get_xdata().max() == table.data["iteration"].max()
+
+        with pytest.raises(ValueError):
+            table.interactive_plot(x="wrong")
+
+        plt.close("all")
+
     def test_slider(self):
         # Exception
         table = ut.Table.fromfile(self.odtfiles[0], x="t")
@@ -163,6 +405,41 @@ class TestTable:
         with pytest.raises(ValueError):
             table.slider(x="wrong")
 
+        # Labels and units of different independent variables
+        table = ut.Table.fromfile(self.odtfiles[0], x="t")
+        slider = table.slider()
+        assert slider.description == "t (ps):"
+        assert slider.options[0][0] == 1.0
+        slider = table.slider(x="mx")
+        assert slider.description == "mx:"
+        assert [label for label, _ in slider.options] == np.around(
+            table.data["mx"], 2
+        ).to_list()
+
+    def test_slider_steps(self):
+        n = 100_000
+        data = pd.DataFrame({"t": np.arange(n) * 1e-12, "mx": np.zeros(n)})
+        table = ut.Table(data, units={"t": "s", "mx": ""}, x="t")
+        t = data["t"].to_numpy()
+
+        slider = table.slider()
+        assert len(slider.options) == ut.table.slider_steps
+        assert slider.value == (t[0], t[-1])
+
+        slider = table.slider(steps=11)
+        assert len(slider.options) == 11
+        # Options are exact values of rows.
+        values = [value for _, value in slider.options]
+        assert np.array_equal(values, t[np.searchsorted(t, values)])
+        assert np.allclose(np.diff(np.searchsorted(t, values)), (n - 1) / 10, atol=1)
+
+        table = ut.Table.fromfile(self.odtfiles[0], x="t")
+        assert len(table.slider().options) == len(table.data)
+        assert len(table.slider(steps=len(table.data) + 1).options) == len(table.data)
+
+        with pytest.raises(ValueError):
+            table.slider(steps=1)
+
     def test_selector(self):
         table = ut.Table.fromfile(self.odtfiles[0], x="t")
         assert isinstance(table.selector(x="t"), ipywidgets.SelectMultiple)
@@ -197,3 +474,709 @@ class TestTable:
         assert np.allclose(ifft_table.data["t"].values, table.data["t"].values)
         for y in ifft_table.y:
             assert np.allclose(ifft_table.data[y].values, table.data[y].values)
+
+    def test_rfft_options(self):
+        table = ut.Table.fromfile(self.odtfiles[12], x="t")
+        table.data = table.data.iloc[:-1]  # odd number of rows
+        fft_table = table.rfft(n=1000, window="hamming", detrend="linear")
+        assert len(fft_table.data) == 501
+        assert np.allclose(np.diff(fft_table.data["f"]), 1 / (1000 * table.dx))
+        assert fft_table.attributes["rfft"]["n"] == 1000
+        assert fft_table.attributes["rfft"]["window"] == "hamming"
+        assert fft_table.attributes["rfft"]["detrend"] == "linear"
+
+        # Options are applied before the transform.
+        mx = table.data["mx"].values
+        rows = np.arange(len(mx))
+        mx = mx - np.polyval(np.polyfit(rows, mx, 1), rows)
+        mx *= np.hamming(len(mx) + 1)[:-1]
+        assert np.allclose(fft_table.data["ft_mx"].values, np.fft.rfft(mx, n=1000))
+
+        # The inverse transform reconstructs the original columns.
+        for kwargs in [
+            {},
+            {"detrend": "constant"},
+            {"n": 1000, "window": "hamming", "detrend": "linear"},
+            {"window": np.linspace(1, 2, len(table.data))},
+        ]:
+            ifft_table = table.rfft(**kwargs).irfft()
+            assert "rfft" not in ifft_table.attributes
+            assert len(ifft_table.data) == len(table.data)
+            for y in table.y:
+                assert np.allclose(ifft_table.data[y].values, table.data[y].values)
+
+        # Values cannot be reconstructed where the window vanishes.
+        ifft_table = table.rfft(window="hann").irfft()
+        assert np.isnan(ifft_table.data["mx"].iloc[0])
+        assert np.allclose(
+            ifft_table.data["mx"].values[1:], table.data["mx"].values[1:]
+        )
+
+        with pytest.raises(ValueError):
+            table.rfft(n=10)
+        with pytest.raises(ValueError):
+            table.rfft(detrend="quadratic")
+        with pytest.raises(ValueError):
+            table.rfft(window=np.ones(10))
+
+    def test_rfft_representation(self):
+        table = ut.Table.fromfile(self.odtfiles[12], x="t")
+        fft_table = table.rfft()
+        polar_table = table.rfft(representation="polar")
+        assert polar_table.y == [f"amplitude_{i}" for i in table.y] + [
+            f"phase_{i}" for i in table.y
+        ]
+        assert polar_table.units["amplitude_mx"] == fft_table.units["ft_mx"]
+        assert polar_table.units["phase_mx"] == "rad"
+        assert polar_table.attributes["rfft"]["representation"] == "polar"
+
+        # Amplitudes and phases.
+        for func, method in [(np.abs, "amplitude"), (np.angle, "phase")]:
+            values = func(fft_table.data[fft_table.y].values)
+            for res in [getattr(fft_table, method)(), getattr(polar_table, method)()]:
+                assert res.x == "f"
+                assert res.y == [f"{method}_{i}" for i in table.y]
+                assert np.allclose(res.data[res.y].values, values)
+                assert res.attributes["rfft"]["representation"] == method
+                with pytest.raises(RuntimeError):
+                    res.irfft()
+
+        amplitude = polar_table.amplitude(y=["mx"])
+        assert amplitude.data.columns.to_list() == ["f", "amplitude_mx"]
+        assert (
+            np.shares_memory(
+                amplitude.data["amplitude_mx"].values,
+                polar_table.data["amplitude_mx"].values,
+            )
+            == ut.table._copy_on_write()
+        )
+
+        # Single precision.
+        for kwargs in [
+            {"dtype": np.complex64},
+            {"representation": "polar", "dtype": np.float32},
+        ]:
+            res = table.rfft(**kwargs)
+            assert all(res.data[i].dtype == kwargs["dtype"] for i in res.y)
+            assert res.data.memory_usage().sum() < fft_table.data.memory_usage().sum()
+
+        # The inverse transform reconstructs the original columns.
+        for res, rtol in [
+            (polar_table, 1e-5),
+            (table.rfft(representation="polar", detrend="linear", n=1000), 1e-5),
+            (table.rfft(representation="polar", dtype=np.float32), 1e-3),
+        ]:
+            ifft_table = res.irfft()
+            for y in table.y:
+                assert np.allclose(
+                    ifft_table.data[y].values,
+                    table.data[y].values,
+                    rtol=rtol,
+                    atol=rtol * np.abs(table.data[y].values).max(),
+                )
+        ifft_table = polar_table.irfft(y=["phase_mx", "amplitude_my"])
+        assert ifft_table.data.columns.to_list() == ["t", "mx", "my"]
+
+        # Peaks of amplitudes.
+        assert np.allclose(
+            polar_table.peaks(n=1).data["f"], fft_table.peaks(n=1).data["f"]
+        )
+
+        with pytest.raises(ValueError):
+            table.rfft(representation="cartesian")
+        with pytest.raises(ValueError):
+            table.rfft(dtype=np.float32)
+        with pytest.raises(ValueError):
+            table.rfft(representation="polar", dtype=np.complex64)
+        with pytest.raises(ValueError):
+            table.amplitude()
+        with pytest.raises(ValueError):
+            table.psd().phase()
+
+    def test_rfft_backend(self):
+        table = ut.Table.fromfile(self.odtfiles[12], x="t")
+        fft_table = table.rfft()
+        for y in table.y:
+            assert np.array_equal(
+                fft_table.data[f"ft_{y}"].values, np.fft.rfft(table.data[y].values)
+            )
+
+        with pytest.raises(ValueError):
+            table.rfft(workers=2)
+
+        with pytest.raises(ValueError):
+            table.rfft(backend="fftw")
+
+        pytest.importorskip("scipy")
+        scipy_table = table.rfft(backend="scipy", workers=2)
+        assert scipy_table.units == fft_table.units
+        assert scipy_table.attributes == fft_table.attributes
+        assert np.allclose(scipy_table.data.values, fft_table.data.values)
+
+        ifft_table = scipy_table.irfft(backend="scipy", workers=-1)
+        for y in table.y:
+            assert np.allclose(ifft_table.data[y].values, table.data[y].values)
+
+    def test_psd(self, monkeypatch):
+        table = ut.Table.fromfile(self.odtfiles[12], x="t")
+        psd_table = table.psd(nperseg=100, window="hamming", overlap=0.25)
+        assert psd_table.x == "f"
+        assert psd_table.y == [f"psd_{i}" for i in table.y]
+        assert psd_table.units["psd_mx"] == f"({table.units['mx']})^2/Hz"
+        assert psd_table.attributes["fourierspace"]
+        assert psd_table.attributes["psd"]["noverlap"] == 25
+        assert len(psd_table.data) == 51
+        assert np.all(psd_table.data[psd_table.y].values >= 0)
+
+        # Parseval's theorem for a periodogram without a window.
+        periodogram = table.psd(y=["mx"], method="periodogram", window="boxcar")
+        mx = table.data["mx"].values
+        assert np.isclose(
+            periodogram.data["psd_mx"].sum() / (table.dx * len(mx)),
+            np.var(mx),
+            rtol=1e-2,
+        )
+
+        monkeypatch.setattr(ut.table, "psd_batchsize", 10)
+        assert np.allclose(
+            table.psd(nperseg=100, window="hamming", overlap=0.25).data.values,
+            psd_table.data.values,
+        )
+
+        with pytest.raises(ValueError):
+            table.psd(method="bartlett")
+        with pytest.raises(ValueError):
+            table.psd(nperseg=1000)
+        with pytest.raises(ValueError):
+            table.psd(overlap=1)
+        with pytest.raises(ValueError):
+            table.psd(window="kaiser")
+        with pytest.raises(ValueError):
+            table.psd(nperseg=100, window=np.ones(50))
+        with pytest.raises(RuntimeError):
+            psd_table.irfft()
+
+        signal = pytest.importorskip("scipy.signal")
+        f, psd = signal.welch(
+            table.data[table.y].values,
+            fs=1 / table.dx,
+            window="hamming",
+            nperseg=100,
+            noverlap=25,
+            axis=0,
+        )
+        assert np.allclose(psd_table.data["f"].values, f)
+        assert np.allclose(psd_table.data[psd_table.y].values, psd)
+
+    def test_resample(self):
+        rng = np.random.default_rng(0)
+        t = np.sort(rng.uniform(0, 1e-9, 1000))
+        data = pd.DataFrame({"t": t, "a": np.sin(2e10 * t), "b": t**2})
+        table = ut.Table(data, units={"t": "s", "a": "", "b": "s^2"}, x="t")
+
+        resampled = table.resample(dx=1e-12)
+        assert resampled.x == "t"
+        assert resampled.units == table.units
+        assert np.isclose(resampled.dx, 1e-12)
+        assert resampled.data["t"].iloc[0] == t[0]
+        assert resampled.data["t"].iloc[-1] <= t[-1]
+        for y in ["a", "b"]:
+            assert np.allclose(
+                resampled.data[y].values, np.interp(resampled.data["t"], t, data[y])
+            )
+
+        # Mean spacing keeps the number of rows.
+        resampled = table.resample(y=["a"])
+        assert resampled.data.columns.to_list() == ["t", "a"]
+        assert len(resampled.data) == len(table.data)
+
+        table.resample().rfft()
+
+        with pytest.raises(ValueError):
+            table.resample(dx=-1)
+        with pytest.raises(ValueError):
+            table.resample(method="quadratic")
+        with pytest.raises(ValueError):
+            ut.Table.fromfile(self.odtfiles[-5], x="B_hysteresis").resample()
+
+        interpolate = pytest.importorskip("scipy.interpolate")
+        resampled = table.resample(dx=1e-12, method="cubic")
+        spline = interpolate.CubicSpline(t, data[["a", "b"]].values)
+        assert np.allclose(
+            resampled.data[["a", "b"]].values, spline(resampled.data["t"].values)
+        )
+
+    def test_psd_lombscargle(self):
+        # Equal to the periodogram for evenly spaced x.
+        table = ut.Table.fromfile(self.odtfiles[12], x="t")
+        lombscargle = table.psd(y=["mx", "my"], method="lombscargle")
+        periodogram = table.psd(y=["mx", "my"], method="periodogram", window="boxcar")
+        assert lombscargle.attributes["psd"]["method"] == "lombscargle"
+        assert np.allclose(lombscargle.data.values, periodogram.data.values)
+
+        rng = np.random.default_rng(0)
+        t = np.sort(rng.uniform(0, 1e-9, 1000))
+        data = pd.DataFrame({"t": t, "a": np.sin(2 * np.pi * 20e9 * t)})
+        table = ut.Table(data, units={"t": "s", "a": ""}, x="t")
+        lombscargle = table.psd(method="lombscargle")
+        f = lombscargle.data["f"].values
+        assert np.isclose(f[lombscargle.data["psd_a"].argmax()], 20e9, rtol=0.05)
+
+    def test_stft(self):
+        table = ut.Table.fromfile(self.odtfiles[12], x="t")
+        stft_table = table.stft(nperseg=100, hop=30, y=["mx", "my"])
+        assert stft_table.data.columns.to_list() == ["t", "f", "stft_mx", "stft_my"]
+        assert stft_table.x is None
+        assert stft_table.units["t"] == "s"
+        assert stft_table.units["stft_mx"] == f"({table.units['mx']})^-1"
+        assert stft_table.attributes["stft"]["shape"] == [14, 51]
+        assert len(stft_table.data) == 14 * 51
+
+        # The last frame is the rfft of the last 100 points.
+        window = np.hanning(101)[:-1]
+        values = stft_table.data["stft_my"].values.reshape(14, 51)
+        my = table.data["my"].values[390:490]
+        assert np.allclose(values[-1], np.fft.rfft(my * window))
+        assert np.isclose(stft_table.data["t"].values[-1], table.data["t"].values[440])
+
+        # Default hop and boxcar window.
+        stft_table = table.stft(nperseg=100, window="boxcar")
+        assert stft_table.attributes["stft"]["hop"] == 50
+        values = stft_table.data["stft_mx"].values.reshape(9, 51)
+        assert np.allclose(values[0], np.fft.rfft(table.data["mx"].values[:100]))
+
+        with pytest.raises(ValueError):
+            table.stft(nperseg=1000)
+        with pytest.raises(ValueError):
+            table.stft(hop=0)
+        with pytest.raises(RuntimeError):
+            stft_table.irfft()
+
+    def test_peaks(self, monkeypatch):
+        # Noisy ringdown with two modes of different frequency in each column.
+        rng = np.random.default_rng(0)
+        t = np.arange(4000) * 1e-12
+        modes = {"a": [5e9, 12e9], "b": [8e9, 20e9]}
+        data = pd.DataFrame({"t": t})
+        for col, freqs in modes.items():
+            data[col] = sum(np.sin(2 * np.pi * f * t) for f in freqs)
+            data[col] *= np.exp(-t / 1e-9)
+            data[col] += 1e-3 * rng.standard_normal(len(t))
+        table = ut.Table(data, units={"t": "s", "a": "A/m", "b": "A/m"}, x="t")
+        fft_table = table.rfft()
+
+        peaks = fft_table.peaks(n=2)
+        assert peaks.data.columns.to_list() == [
+            "column",
+            "f",
+            "amplitude",
+            "prominence",
+            "linewidth",
+        ]
+        assert peaks.units["f"] == "Hz"
+        assert peaks.units["amplitude"] == "(A/m)^-1"
+        assert peaks.data["column"].to_list() == ["ft_a", "ft_a", "ft_b", "ft_b"]
+        df = fft_table.data["f"].iloc[1]
+        for col, freqs in modes.items():
+            mode_peaks = peaks.data[peaks.data["column"] == f"ft_{col}"]
+            assert np.allclose(mode_peaks["f"], freqs, atol=df / 2)
+            # Width of Lorentzian magnitude sqrt(3) / (pi * tau).
+            linewidth = np.sqrt(3) / (np.pi * 1e-9)
+            assert np.allclose(mode_peaks["linewidth"], linewidth, rtol=0.2)
+
+        unrefined = fft_table.peaks(n=2, refine=False)
+        assert np.all(unrefined.data["f"].isin(fft_table.data["f"]))
+        assert np.all(peaks.data["amplitude"] >= unrefined.data["amplitude"])
+
+        # Filtering by prominence.
+        all_peaks = fft_table.peaks()
+        threshold = peaks.data["prominence"].min()
+        assert len(all_peaks.data) > 4
+        assert len(fft_table.peaks(prominence=threshold).data) == 4
+
+        # Batches and limited windows.
+        monkeypatch.setattr(ut.table, "peaks_batchsize", 100)
+        assert fft_table.peaks().data.equals(all_peaks.data)
+        assert len(fft_table.peaks(wlen=5).data) == len(all_peaks.data)
+
+        # Power spectral density.
+        psd_peaks = table.psd(nperseg=1000).peaks(n=2, y=["psd_a"])
+        assert psd_peaks.data["column"].to_list() == ["psd_a", "psd_a"]
+        assert np.allclose(psd_peaks.data["f"], modes["a"], rtol=0.1)
+
+        with pytest.raises(ValueError):
+            table.peaks()
+
+        signal = pytest.importorskip("scipy.signal")
+        for col in ["ft_a", "ft_b"]:
+            values = np.abs(fft_table.data[col].values)
+            indices, properties = signal.find_peaks(values, prominence=0, width=0)
+            col_peaks = fft_table.peaks(y=[col], refine=False).data
+            assert np.allclose(col_peaks["f"], fft_table.data["f"].values[indices])
+            assert np.allclose(col_peaks["prominence"], properties["prominences"])
+            assert np.allclose(col_peaks["linewidth"], properties["widths"] * df)
+
+        # Plateaus are peaks only if they drop on both sides.
+        data = pd.DataFrame(
+            {
+                "f": np.arange(6.0),
+                "a": [0.1, 0.5, 0.5, 0.7, 0.2, 0.1],
+                "b": [0.1, 0.5, 0.5, 0.5, 0.2, 0.1],
+                "c": [0.1, 0.5, 0.5, 0.2, 0.3, 0.3],
+            }
+        )
+        units = {"f": "Hz", "a": "", "b": "", "c": ""}
+        table = ut.Table(data, units=units, x="f", attributes={"fourierspace": True})
+        plateau_peaks = table.peaks(refine=False).data
+        assert plateau_peaks["column"].to_list() == ["a", "b", "c"]
+        assert plateau_peaks["f"].to_list() == [3, 2, 1]
+        assert np.allclose(plateau_peaks["prominence"], [0.6, 0.4, 0.3])
+        for col in "abc":
+            indices, properties = signal.find_peaks(data[col].values, prominence=0)
+            col_peaks = plateau_peaks[plateau_peaks["column"] == col]
+            assert np.array_equal(col_peaks["f"], indices)
+            assert np.allclose(col_peaks["prominence"], properties["prominences"])
+
+    def test_mpl_spectrogram(self):
+        table = ut.Table.fromfile(self.odtfiles[12], x="t")
+        stft_table = table.stft(nperseg=100, hop=25)
+
+        stft_table.mpl_spectrogram()
+        stft_table.mpl_spectrogram("stft_my", log=True, multiplier=1e-12)
+        stft_table.data = stft_table.data[["stft_mz", "f", "t", "stft_mx"]]
+        stft_table.mpl_spectrogram()
+        assert plt.gca().figure.axes[-1].get_ylabel() == "|stft_mz|"
+
+        fig = plt.figure(figsize=(10, 8))
+        ax = fig.add_subplot(111)
+        stft_table.mpl_spectrogram(ax=ax, cmap="magma")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stft_table.mpl_spectrogram(filename=os.path.join(tmpdir, "stft.pdf"))
+
+        with pytest.raises(ValueError):
+            stft_table.mpl_spectrogram("mx")
+        with pytest.raises(ValueError):
+            table.mpl_spectrogram()
+
+        plt.close("all")
+
+    def test_iter_chunks(self):
+        for odtfile in self.odtfiles:
+            table = ut.Table.fromfile(odtfile)
+            chunks = list(ut.Table.iter_chunks(odtfile, chunksize=50))
+
+            for chunk in chunks:
+                check_table(chunk)
+                assert chunk.units == table.units
+                assert len(chunk.data) <= 50
+
+            data = pd.concat([chunk.data for chunk in chunks])
+            assert data.columns.to_list() == table.data.columns.to_list()
+            assert data.index.equals(table.data.index)
+            assert np.array_equal(data.to_numpy(), table.data.to_numpy())
+
+        chunks = list(ut.Table.iter_chunks(self.odtfiles[0], x="t"))
+        assert len(chunks) == 1
+        assert chunks[0].x == "t"
+
+        with pytest.raises(ValueError):
+            next(ut.Table.iter_chunks(self.odtfiles[0], chunksize=0))
+
+    def test_cache(self, tmp_path, monkeypatch):
+        for odtfile in self.odtfiles:
+            table = ut.Table.fromfile(odtfile)
+            filename = tmp_path / "table.npz"
+            table.to_cache(filename)
+            res = ut.Table.from_cache(filename)
+            check_table(res)
+            assert res.data.equals(table.data)
+            assert res.units == table.units
+            assert res.x is None
+
+        # Fourier transformed table
+        table = ut.Table.fromfile(self.odtfiles[12], x="t").rfft()
+        table.to_cache(tmp_path / "subdir" / "fft.npz")
+        res = ut.Table.from_cache(tmp_path / "subdir" / "fft.npz")
+        assert res.data.equals(table.data)
+        assert res.x == "f"
+        assert res.attributes == table.attributes
+
+        # fromfile
+        odtfile = tmp_path / "table.odt"
+        with open(self.odtfiles[0], "rb") as f:
+            odtfile.write_bytes(f.read())
+        cachedir = tmp_path / "cache"
+
+        table = ut.Table.fromfile(odtfile, x="t", cache=cachedir)
+        assert len(os.listdir(cachedir)) == 1
+        res = ut.Table.fromfile(odtfile, x="iteration", cache=cachedir)
+        assert res.x == "iteration"
+        assert res.data.equals(table.data)
+        assert len(os.listdir(cachedir)) == 1
+
+        # Changed file is read again.
+        with open(self.odtfiles[1], "rb") as f:
+            odtfile.write_bytes(f.read())
+        os.utime(odtfile, ns=(0, 0))
+        res = ut.Table.fromfile(odtfile, x="t", cache=cachedir)
+        assert res.data.equals(ut.Table.fromfile(self.odtfiles[1], x="t").data)
+        assert len(os.listdir(cachedir)) == 2
+
+        # Corrupt or concurrently evicted cached tables are read again.
+        expected = ut.Table.fromfile(self.odtfiles[1], x="t").data
+        for path in cachedir.iterdir():
+            path.write_bytes(b"corrupt")
+        res = ut.Table.fromfile(odtfile, x="t", cache=cachedir)
+        assert res.data.equals(expected)
+
+        for path in cachedir.iterdir():
+            np.savez(path, column0=[1.0])  # no metadata
+        res = ut.Table.fromfile(odtfile, x="t", cache=cachedir)
+        assert res.data.equals(expected)
+
+        def evicted(filename, /, columns=None):
+            table = from_cache(filename, columns=columns)
+            os.remove(filename)
+            return table
+
+        from_cache = ut.Table.from_cache
+        monkeypatch.setattr(ut.Table, "from_cache", evicted)
+        res = ut.Table.fromfile(odtfile, x="t", cache=cachedir)
+        assert res.data.equals(expected)
+
+    @pytest.mark.parametrize("fmt", ["cache", "parquet", "hdf5"])
+    def test_serialisation(self, tmp_path, fmt):
+        if fmt == "parquet":
+            pytest.importorskip("pyarrow")
+        elif fmt == "hdf5":
+            pytest.importorskip("tables")
+        write = getattr(ut.Table, f"to_{fmt}")
+        read = getattr(ut.Table, f"from_{fmt}")
+        filename = tmp_path / f"table.{fmt}"
+
+        table = ut.Table.fromfile(self.odtfiles[12], x="t")
+        for res in [table, table.rfft()]:
+            write(res, filename)
+            for columns in [None, res.data.columns.to_list()]:
+                new = read(filename, columns=columns)
+                assert isinstance(new, ut.Table)
+                assert new.data.equals(res.data)
+                assert new.units == res.units
+                assert new.x == res.x
+                assert new.attributes == res.attributes
+
+        # Duplicated column names
+        table = ut.Table.fromfile(self.odtfiles[-1])
+        write(table, filename)
+        res = read(filename)
+        assert res.data.equals(table.data)
+        assert res.units == table.units
+
+        # Subset of columns
+        table = ut.Table.fromfile(self.odtfiles[12], x="t")
+        write(table, filename)
+        res = read(filename, columns=["mz", "t", "mx"])
+        assert res.data.columns.to_list() == ["mz", "t", "mx"]
+        assert res.data.equals(table.data[["mz", "t", "mx"]])
+        assert res.units == {"t": "s", "mx": "", "mz": ""}
+        assert res.x == "t"
+
+        res = read(filename, columns=["mx"])
+        assert res.x is None
+
+        # Index
+        odtfiles = self.odtfiles[:2]
+        for keys in [None, ["a", "bc"]]:
+            table = ut.Table.fromfiles(odtfiles, x="t", stack=True, keys=keys)
+            write(table, filename)
+            for columns in [None, ["mx", "t"]]:
+                res = read(filename, columns=columns)
+                assert res.data.index.equals(table.data.index)
+                assert res.data.index.names == ["run", None]
+            assert res.data.equals(table.data[["mx", "t"]])
+
+        chunk = list(ut.Table.iter_chunks(self.odtfiles[0], x="t", chunksize=10))[1]
+        write(chunk, filename)
+        res = read(filename)
+        assert res.data.index.to_list() == list(range(10, 20))
+        assert res.data.equals(chunk.data)
+
+        with pytest.raises(ValueError):
+            read(filename, columns=["t", "wrong"])
+
+    def test_fromfiles(self):
+        odtfiles = self.odtfiles[:2]
+        for workers in [1, 2]:
+            tables = ut.Table.fromfiles(odtfiles, x="t", workers=workers)
+            assert len(tables) == 2
+            for table, odtfile in zip(tables, odtfiles):
+                check_table(table)
+                assert table.data.equals(ut.Table.fromfile(odtfile).data)
+
+        # Different columns
+        odtfiles = self.odtfiles[:3]
+        tables = ut.Table.fromfiles(odtfiles)
+        columns = tables[0].data.columns.to_list()
+        assert all(table.data.columns.to_list() == columns for table in tables)
+        assert all(table.units == tables[0].units for table in tables)
+        assert tables[2].data["t"].isna().all()
+        assert tables[0].data["max_mxHxm"].isna().all()
+
+        # Stacking
+        table = ut.Table.fromfiles(odtfiles, stack=True, keys=[10, 20, 30])
+        assert isinstance(table, ut.Table)
+        assert table.data.index.names == ["run", None]
+        assert table.data.loc[20].equals(tables[1].data)
+        assert len(table.data) == sum(len(t.data) for t in tables)
+
+        table = ut.Table.fromfiles(self.odtfiles[:2], x="t", stack=True)
+        assert table.data.index.get_level_values("run").unique().to_list() == [0, 1]
+        assert table.x == "t"
+
+        # Duplicated column names
+        odtfiles = [self.odtfiles[-1], self.odtfiles[0]]  # oommf-issue1.odt first
+        tables = ut.Table.fromfiles(odtfiles)
+        duplicated = ut.Table.fromfile(odtfiles[0])
+        assert duplicated.data.columns.has_duplicates
+        columns = tables[0].data.columns.to_list()
+        assert tables[1].data.columns.to_list() == columns
+        assert tables[0].data.iloc[:, :30].equals(duplicated.data)
+        assert columns.count("E") == duplicated.data.columns.to_list().count("E")
+
+    def test_usecols(self, tmp_path):
+        table = ut.Table.fromfile(self.odtfiles[0], x="t")
+        for cache in [False, tmp_path, tmp_path]:  # read from cache last time
+            res = ut.Table.fromfile(
+                self.odtfiles[0], x="t", usecols=["t", "mx", "E"], cache=cache
+            )
+            check_table(res)
+            assert res.y == ["mx", "E"]
+            assert res.units == {"t": "s", "mx": "", "E": "J"}
+            assert res.data.equals(table.data[["t", "mx", "E"]])
+
+        with pytest.raises(ValueError):
+            ut.Table.fromfile(self.odtfiles[0], x="t", usecols=["mx"])
+
+    def test_apply(self, monkeypatch):
+        table = ut.Table.fromfile(self.odtfiles[0], x="t")
+        table.attributes["key"] = "value"
+
+        res = table.apply(np.abs)
+        check_table(res)
+        assert res.attributes == table.attributes
+        assert res.data[table.y].equals(table.data[table.y].abs())
+        assert res.data["t"].equals(table.data["t"])
+
+        # Vectorised and column-wise paths give the same result.
+        for func, kwargs in [
+            (np.multiply, {"args": (2,)}),
+            (np.vectorize(lambda x: x**2), {}),
+            (lambda x, a: x + a, {"a": 1}),
+        ]:
+            for columns in [None, ["mx", "my"]]:
+                res1 = table.apply(func, columns=columns, vectorized=True, **kwargs)
+                res2 = table.apply(func, columns=columns, vectorized=False, **kwargs)
+                assert list(res1.data.columns) == list(table.data.columns)
+                pd.testing.assert_frame_equal(res1.data, res2.data)
+
+        # Duplicated column names
+        table2 = ut.Table.fromfile(self.odtfiles[-1])
+        assert table2.data.columns.has_duplicates
+        for columns in [None, ["E", "mx"]]:
+            res1 = table2.apply(np.abs, columns=columns)
+            res2 = table2.apply(np.abs, columns=columns, vectorized=False)
+            pd.testing.assert_frame_equal(res1.data, res2.data)
+
+        # Unselected columns are copied if pandas does not copy on write.
+        for copy_on_write in [True, False]:
+            monkeypatch.setattr(ut.table, "_copy_on_write", lambda c=copy_on_write: c)
+            res = table.apply(np.abs, columns=["mx"])
+            shared = np.shares_memory(
+                res.data["my"].to_numpy(), table.data["my"].to_numpy()
+            )
+            assert shared == copy_on_write
+
+        # Per-row arguments are passed to each column.
+        mx = table.data["mx"]
+        for arg in [np.arange(len(mx)), mx]:
+            res = table.apply(np.add, columns=["mx", "my"], args=(arg,))
+            assert np.allclose(res.data["mx"], mx + np.asarray(arg))
+            res = table.apply(np.vectorize(lambda x, a: x + a), columns=["mx"], a=arg)
+            assert np.allclose(res.data["mx"], mx + np.asarray(arg))
+
+        # Data types of columns are kept.
+        table32 = ut.Table.fromfile(self.odtfiles[0], x="t", dtype=np.float32)
+        assert table32.data["iteration"].dtype == np.int32
+        res = table32.apply(np.abs)
+        assert res.data.dtypes.equals(table32.data.dtypes)
+        res = table32.apply(np.abs, columns=["mx", "my"])
+        assert res.data.dtypes.equals(table32.data.dtypes)
+
+        # Non-vectorised functions receive pandas.Series.
+        res = table.apply(lambda x: x.diff().fillna(0), columns=["mx"])
+        assert res.data["mx"].equals(table.data["mx"].diff().fillna(0))
+
+        with pytest.raises(ValueError):
+            table.apply(np.sum, vectorized=True)
+
+        data = table.data
+        xmax = table.xmax
+        assert table.apply(np.multiply, columns=["t"], args=(2,), inplace=True) is None
+        assert table.xmax == 2 * xmax  # cached metadata is not used
+        assert table.data["t"].equals(2 * data["t"])
+        assert not data["t"].equals(table.data["t"])  # original data not modified
+
+    def test_dtype(self, tmp_path):
+        table = ut.Table.fromfile(self.odtfiles[0], x="t")
+        for cache in [False, tmp_path, tmp_path]:  # read from cache last time
+            res = ut.Table.fromfile(
+                self.odtfiles[0], x="t", dtype=np.float32, cache=cache
+            )
+            check_table(res)
+            assert res.units == table.units
+            assert res.data["mx"].dtype == np.float32
+            assert res.data["iteration"].dtype == np.int32
+            assert np.allclose(res.data, table.data, rtol=1e-6)
+
+        # Different dtypes are cached separately.
+        res = ut.Table.fromfile(self.odtfiles[0], x="t", cache=tmp_path)
+        assert res.data.equals(table.data)
+
+    def test_astype(self):
+        table = ut.Table.fromfile(self.odtfiles[0], x="t")
+        table.attributes["key"] = "value"
+
+        res = table.astype(np.float32)
+        check_table(res)
+        assert (res.data.dtypes == np.float32).all()
+        assert res.units == table.units
+        assert res.x == table.x
+        assert res.attributes == table.attributes
+        assert table.data["mx"].dtype == np.float64  # not modified
+
+        res = table.astype({"iteration": np.int32})
+        assert res.data["iteration"].dtype == np.int32
+        assert res.data["mx"].dtype == np.float64
+
+    def test_rows(self, tmp_path):
+        table = ut.Table.fromfile(self.odtfiles[12], x="t")
+        for cache in [False, tmp_path, tmp_path]:  # read from cache last time
+            res = ut.Table.fromfile(
+                self.odtfiles[12], x="t", rows=slice(None, None, 10), cache=cache
+            )
+            check_table(res)
+            assert np.array_equal(res.data.to_numpy(), table.data.to_numpy()[::10])
+
+            res = ut.Table.fromfile(
+                self.odtfiles[12], x="t", x_range=(1e-9, 2e-9), cache=cache
+            )
+            check_table(res)
+            assert res.data["t"].min() >= 1e-9
+            assert res.data["t"].max() <= 2e-9
+            assert (
+                len(res.data) == ((table.data.t >= 1e-9) & (table.data.t <= 2e-9)).sum()
+            )
+
+        with pytest.raises(ValueError):
+            ut.Table.fromfile(self.odtfiles[12], x_range=(1e-9, 2e-9))
@@ -2,6 +2,10 @@ import itertools
 import numbers
 import os
 
+import numpy as np
+import pandas as pd
+import pytest
+
 import ubermagtable.util as uu
 
 dirname = os.path.join(os.path.dirname(__file__), "test_sample/")
@@ -53,3 +57,240 @@ def test_data():
 
         assert isinstance(data, list)
         assert all(isinstance(i, numbers.Real) for i in itertools.chain(*data))
+
+
+def test_read():
+    for odtfile in odtfiles:
+        for rename in [True, False]:
+            data, units = uu.read(odtfile, rename=rename)
+
+            assert isinstance(data, pd.DataFrame)
+            assert data.columns.to_list() == uu.columns(odtfile, rename=rename)
+            assert all(dtype == np.float64 for dtype in data.dtypes)
+            assert np.array_equal(data.to_numpy(), uu.data(odtfile))
+            assert units == uu.units(odtfile, rename=rename)
+
+
+def test_read_mmap(monkeypatch):
+    for odtfile in odtfiles:
+        data, units = uu.read(odtfile)
+        data_mmap, units_mmap = uu.read(odtfile, mmap=True)
+
+        assert data_mmap.columns.to_list() == data.columns.to_list()
+        assert np.array_equal(data_mmap.to_numpy(), data.to_numpy())
+        assert units_mmap == units
+
+    # Many small blocks.
+    monkeypatch.setattr(uu.util, "mmap_blocksize", 100)
+    for odtfile in odtfiles:
+        data, _ = uu.read(odtfile)
+        data_mmap, _ = uu.read(odtfile, mmap=True)
+        assert np.array_equal(data_mmap.to_numpy(), data.to_numpy())
+
+
+def test_read_chunks():
+    for odtfile in odtfiles:
+        data, units = uu.read(odtfile)
+        chunks = list(uu.read_chunks(odtfile, chunksize=3))
+
+        assert all(chunk_units == units for _, chunk_units in chunks)
+        assert np.array_equal(
+            np.concatenate([chunk.to_numpy() for chunk, _ in chunks]),
+            data.to_numpy(),
+        )
+
+
+def test_cache_path(tmp_path):
+    path = uu.cache_path(odtfiles[0], directory=tmp_path)
+    assert os.path.dirname(path) == str(tmp_path)
+    assert path.endswith(".npz")
+    assert uu.cache_path(odtfiles[0], directory=tmp_path) == path
+    assert uu.cache_path(odtfiles[0], rename=False, directory=tmp_path) != path
+    assert uu.cache_path(odtfiles[1], directory=tmp_path) != path
+
+
+def test_evict_cache(tmp_path):
+    for i in range(5):
+        path = tmp_path / f"{i}.npz"
+        path.write_bytes(b"0" * 100)
+        os.utime(path, (i, i))
+    (tmp_path / "other.txt").write_bytes(b"0" * 100)
+
+    uu.evict_cache(1000, directory=tmp_path)
+    assert len(os.listdir(tmp_path)) == 6
+
+    uu.evict_cache(250, directory=tmp_path)
+    assert sorted(os.listdir(tmp_path)) == ["3.npz", "4.npz", "other.txt"]
+
+    uu.evict_cache(0, directory=tmp_path)
+    assert os.listdir(tmp_path) == ["other.txt"]
+
+    uu.evict_cache(0, directory=tmp_path / "nonexistent")
+
+
+def test_read_usecols():
+    for odtfile in odtfiles:
+        data, units = uu.read(odtfile)
+        usecols = data.columns[::-3].to_list()
+        for mmap in [False, True]:
+            res, res_units = uu.read(odtfile, mmap=mmap, usecols=usecols)
+            assert res.columns.to_list() == usecols
+            assert np.array_equal(res.to_numpy(), data[usecols].to_numpy())
+            assert res_units == {col: units[col] for col in usecols}
+
+    # Original column names
+    odtfile = odtfiles[0]
+    data, units = uu.read(odtfile, usecols=["TimeDriver::Simulation time", "mx"])
+    assert data.columns.to_list() == ["t", "mx"]
+    assert units == {"t": "s", "mx": ""}
+
+    data, _ = uu.read(odtfile, rename=False, usecols=["TimeDriver::mx"])
+    assert data.columns.to_list() == ["TimeDriver::mx"]
+
+    # Renamed column names without renaming
+    data, _ = uu.read(odtfile, rename=False, usecols=["t", "mx"])
+    assert data.columns.to_list() == ["TimeDriver::Simulation time", "TimeDriver::mx"]
+
+    data, _ = uu.read(odtfile, rename=False, x="t", x_range=(None, 1e-11))
+    assert data["TimeDriver::Simulation time"].max() <= 1e-11
+
+    with pytest.raises(ValueError):
+        uu.read(odtfile, usecols=["t", "wrong"])
+
+
+def test_read_rows():
+    for odtfile in odtfiles:
+        data, _ = uu.read(odtfile)
+        for rows in [
+            slice(None),
+            slice(2, None),
+            slice(None, 3),
+            slice(1, 8, 3),
+            slice(None, None, 4),
+            slice(-5, None),
+            slice(-7, -2, 2),
+            slice(100, 200),
+        ]:
+            res, _ = uu.read(odtfile, rows=rows)
+            assert np.array_equal(res.to_numpy(), data.to_numpy()[rows])
+
+        res, _ = uu.read(odtfile, rows=slice(1, 5), usecols=data.columns[:2])
+        assert np.array_equal(res.to_numpy(), data.iloc[1:5, :2].to_numpy())
+
+    with pytest.raises(ValueError):
+        uu.read(odtfiles[0], rows=slice(None, None, -1))
+
+
+def test_read_x_range():
+    odtfile = odtfiles[0]
+    data, _ = uu.read(odtfile)
+    t = data["t"].to_numpy()
+    for x_range, mask in [
+        ((5e-12, 1e-11), (t >= 5e-12) & (t <= 1e-11)),
+        ((None, 1e-11), t <= 1e-11),
+        ((1e-11, None), t >= 1e-11),
+        ((1, 2), np.zeros_like(t, dtype=bool)),
+    ]:
+        res, _ = uu.read(odtfile, x="t", x_range=x_range)
+        assert np.array_equal(res.to_numpy(), data.to_numpy()[mask])
+
+        res, _ = uu.read(odtfile, x="t", x_range=x_range, rows=slice(-3, None, 2))
+        assert np.array_equal(res.to_numpy(), data.to_numpy()[mask][-3::2])
+
+        res, _ = uu.read(odtfile, usecols=["mx"], x="t", x_range=x_range)
+        assert np.array_equal(res.to_numpy(), data[["mx"]].to_numpy()[mask])
+
+    with pytest.raises(ValueError):
+        uu.read(odtfile, x_range=(0, 1))
+    with pytest.raises(ValueError):
+        uu.read(odtfile, x="wrong", x_range=(0, 1))
+
+
+def test_read_dtype():
+    for odtfile in odtfiles:
+        data, units = uu.read(odtfile)
+        res, res_units = uu.read(odtfile, dtype=np.float32)
+
+        assert res_units == units
+        assert list(res.columns) == list(data.columns)
+        assert res.memory_usage().sum() < data.memory_usage().sum()
+        for column in res.columns:
+            if column in uu.integer_columns:
+                assert res[column].dtype == np.int32
+                assert np.array_equal(res[column], data[column])
+            else:
+                assert res[column].dtype == np.float32
+                assert np.allclose(res[column], data[column], rtol=1e-6)
+
+    res, _ = uu.read(odtfiles[0], usecols=["t", "iteration"], dtype=np.float64)
+    assert res["t"].dtype == np.float64
+    assert res["iteration"].dtype == np.int64
+
+    res, _ = uu.read(odtfiles[0], rename=False, dtype=np.float32)
+    assert res["TimeDriver::Iteration"].dtype == np.int32
+
+    with pytest.raises(ValueError):
+        uu.read(odtfiles[0], dtype=int)
+
+
+def test_rename_column():
+    assert uu.rename_column("TimeDriver::mx", uu.oommf_dict) == "mx"
+    assert uu.rename_column("UniformExchange::Energy", uu.oommf_dict) == "E_exchange"
+    assert (
+        uu.rename_column("UniformExchange:exchange:Energy", uu.oommf_dict)
+        == "E_exchange"
+    )
+    assert uu.rename_column("Demag:demag:Energy", uu.oommf_dict) == "E_demag"
+    assert uu.rename_column("Unknown:term:Energy", uu.oommf_dict) == (
+        "Unknown:term:Energy"
+    )
+    assert uu.rename_column("E_total", uu.mumax3_dict) == "E"
+    assert uu.rename_column("unknown", uu.mumax3_dict) == "unknown"
+    # Dictionaries which are not precompiled
+    assert uu.rename_column("Module:term:Name", {"Module::Name": "N"}) == "N_term"
+
+
+def test_register_oommf_columns(tmp_path):
+    odtfile = tmp_path / "custom.odt"
+    with open(odtfiles[0]) as f:
+        lines = f.readlines()
+    lines[3] = lines[3].replace("{Oxs_RungeKuttaEvolve::Delta E}", "Foo_Bar:baz:Qux")
+    odtfile.write_text("".join(lines))
+    assert len(uu.columns(odtfile)) == len(uu.columns(odtfiles[0])) - 1
+
+    try:
+        uu.register_oommf_columns({"Bar::Qux": "qux"}, prefixes=["Foo_"])
+        assert "qux_baz" in uu.columns(odtfile)
+        assert uu.columns(odtfile, rename=False)[4] == "Bar:baz:Qux"
+    finally:
+        del uu.oommf_dict["Bar::Qux"]
+        uu.oommf_prefixes.remove("Foo_")
+
+    assert len(uu.columns(odtfile)) == len(uu.columns(odtfiles[0])) - 1
+
+    # Editing dictionaries directly
+    try:
+        uu.oommf_dict["MyEvolver::Max torque"] = "max_torque"
+        assert uu.rename_column("MyEvolver:ev:Max torque", uu.oommf_dict) == (
+            "max_torque_ev"
+        )
+        uu.oommf_dict["Bar::Qux"] = "qux"
+        uu.oommf_prefixes.append("Foo_")
+        assert "qux_baz" in uu.columns(odtfile)
+    finally:
+        del uu.oommf_dict["MyEvolver::Max torque"]
+        del uu.oommf_dict["Bar::Qux"]
+        uu.oommf_prefixes.remove("Foo_")
+
+    assert uu.rename_column("MyEvolver:ev:Max torque", uu.oommf_dict) == (
+        "MyEvolver:ev:Max torque"
+    )
+    assert "qux_baz" not in uu.columns(odtfile)
+
+    # Replacing a rule without changing the number of rules
+    rules = {"A::B": "b", "C::D": "d"}
+    assert uu.rename_column("A:x:B", rules) == "b_x"
+    del rules["A::B"]
+    rules["A::E"] = "e"
+    assert uu.rename_column("A:x:B", rules) == "A:x:B"
+    assert uu.rename_column("A:x:E", rules) == "e_x"
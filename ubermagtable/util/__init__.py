@@ -1,5 +1,15 @@
 """Utility tools"""
 
+from .util import cache_path as cache_path
 from .util import columns as columns
 from .util import data as data
+from .util import evict_cache as evict_cache
+from .util import integer_columns as integer_columns
+from .util import mumax3_dict as mumax3_dict
+from .util import oommf_dict as oommf_dict
+from .util import oommf_prefixes as oommf_prefixes
+from .util import read as read
+from .util import read_chunks as read_chunks
+from .util import register_oommf_columns as register_oommf_columns
+from .util import rename_column as rename_column
 from .util import units as units
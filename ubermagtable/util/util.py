@@ -1,4 +1,22 @@
+import functools
+import hashlib
+import io
+import itertools
+import mmap
+import os
 import re
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# Approximate size (in bytes) of a block of lines parsed at once when reading
+# memory-mapped files.
+mmap_blocksize = 2**24
+
+# Maximum total size (in bytes) of cached tables in a cache directory. The
+# least recently used tables are removed when it is exceeded.
+cache_maxsize = 2**30
 
 # The OOMMF columns are renamed according to this dictionary.
 oommf_dict = {
@@ -134,24 +152,129 @@ mumax3_dict = {
 }
 
 
+# Counters of OOMMF drivers and evolvers (after renaming), which are stored as
+# integers if ``dtype`` is passed to ``read``.
+integer_columns = {
+    "iteration",
+    "stage",
+    "stage_iteration",
+    *(name for name in oommf_dict.values() if name.endswith("_count")),
+}
+
+# Indices of renaming rules (see ``_split_index``) keyed by ``id`` of the
+# renaming dictionaries.
+_indices = {}
+
+# Prefixes of OOMMF modules (``Oxs_`` and extensions) in column names.
+oommf_prefixes = ["Oxs_", "Anv_", "Southampton_", "My_", "YY_", "UHH_", "Xf_"]
+
+
 def rename_column(name, cols_dict):
     if name in cols_dict:
         return cols_dict[name]
 
-    for key in cols_dict:
-        if len(key.split("::")) == 2:
-            start, end = key.split("::")
-            name_split = name.split(":")
-            if name_split[0] == start and name_split[-1] == end:
-                term_name = name.split(":")[1]
-                type_name = cols_dict[key]
-                # required for E_exchange in old and new OOMMF odt files
-                if not type_name.endswith(term_name):
-                    type_name = f"{type_name}_{term_name}"
-                return type_name
-    else:
+    name_split = name.split(":")
+    start_end = name_split[0], name_split[-1]
+    key = _split_index(cols_dict).get(start_end)
+    if key is not None and key not in cols_dict:  # rule removed
+        key = _split_index(cols_dict, rebuild=True).get(start_end)
+    if key is None:
         return name  # name cannot be found in dictionary
 
+    type_name = cols_dict[key]
+
+    term_name = name_split[1] if len(name_split) > 1 else ""
+    # required for E_exchange in old and new OOMMF odt files
+    if not type_name.endswith(term_name):
+        type_name = f"{type_name}_{term_name}"
+    return type_name
+
+
+def register_oommf_columns(rules=None, prefixes=None):
+    """Registers renaming rules for OOMMF columns.
+
+    This function can be used to rename columns written by OOMMF extension
+    modules. Renaming rules are added to ``oommf_dict``. Similar to the
+    existing rules, a key ``'Module::Name'`` renames all columns
+    ``Module:<term>:Name`` to ``<value>_<term>``. Module prefixes (e.g.
+    ``'Anv_'``), which are removed from the column names, are added to
+    ``oommf_prefixes``. Renaming rules are precompiled into an index, so that
+    renaming does not become slower with the number of rules. The index is
+    rebuilt whenever rules are added or removed, so editing ``oommf_dict``
+    directly also works. Note that ``integer_columns`` is not updated; custom
+    counters can be added to it directly.
+
+    Parameters
+    ----------
+    rules : dict, optional
+
+        Dictionary mapping column names (without the module prefix) to their
+        shorter versions. Defaults to ``None``.
+
+    prefixes : list, optional
+
+        Module prefixes. Defaults to ``None``.
+
+    Examples
+    --------
+    1. Renaming columns of a custom ``My_Evolver`` module.
+
+    >>> import ubermagtable.util as uu
+    ...
+    >>> uu.register_oommf_columns({'Evolver::Max torque': 'max_torque'})
+    >>> uu.rename_column('Evolver:evolver:Max torque', uu.oommf_dict)
+    'max_torque_evolver'
+
+    Rules can be removed from ``oommf_dict`` again.
+
+    >>> del uu.oommf_dict['Evolver::Max torque']
+    >>> uu.rename_column('Evolver:evolver:Max torque', uu.oommf_dict)
+    'Evolver:evolver:Max torque'
+
+    """
+    if rules is not None:
+        oommf_dict.update(rules)
+    if prefixes is not None:
+        oommf_prefixes.extend(p for p in prefixes if p not in oommf_prefixes)
+
+
+def _split_index(cols_dict, rebuild=False):
+    """Index of renaming rules ``'start::end'`` keyed by ``(start, end)``.
+
+    The index maps to keys of ``cols_dict``, so that the current values are
+    used. It is cached per dictionary and rebuilt when the number of rules or
+    the last rule changes, or a rule it refers to is removed.
+
+    """
+    state = (len(cols_dict), next(reversed(cols_dict), None))
+    cached = _indices.get(id(cols_dict))
+    if (
+        not rebuild
+        and cached is not None
+        and cached[0] is cols_dict
+        and cached[1] == state
+    ):
+        return cached[2]
+
+    index = {}
+    for key in cols_dict:
+        if len(key_split := key.split("::")) == 2:
+            index.setdefault(tuple(key_split), key)  # first rule applies
+
+    if len(_indices) >= 16:
+        _indices.clear()
+    _indices[id(cols_dict)] = (cols_dict, state, index)
+    return index
+
+
+def _renaming_state():
+    """Renaming rules and prefixes, which header parsing depends on."""
+    return (
+        tuple(oommf_dict.items()),
+        tuple(mumax3_dict.items()),
+        tuple(oommf_prefixes),
+    )
+
 
 def columns(filename, rename=True):
     """Extracts column names from a table file.
@@ -193,24 +316,10 @@ def columns(filename, rename=True):
     [...]
 
     """
-    with open(filename) as f:
-        lines = f.readlines()
+    with open(filename, "rb") as f:
+        lines = _read_header(f)
 
-    if lines[0].startswith("# ODT"):  # OOMMF odt file
-        cline = list(filter(lambda line: line.startswith("# Columns:"), lines))[0]
-        cline = re.split(r"Oxs_|Anv_|Southampton_|My_|YY_|UHH_|Xf_", cline)[1:]
-        cline = list(map(lambda col: re.sub(r"[{}]", "", col), cline))
-        cols = list(map(lambda s: s.strip(), cline))
-        cols_dict = oommf_dict
-    else:  # mumax3 txt file
-        cline = lines[0][2:].rstrip().split("\t")
-        cols = list(map(lambda s: s.split(" ")[0], cline))
-        cols_dict = mumax3_dict
-
-    if rename:
-        return [rename_column(col, cols_dict) for col in cols]
-    else:
-        return cols
+    return _columns(lines, rename=rename)
 
 
 def units(filename, rename=True):
@@ -256,19 +365,10 @@ def units(filename, rename=True):
     {...}
 
     """
-    with open(filename) as f:
-        lines = f.readlines()
-
-    if lines[0].startswith("# ODT"):  # OOMMF odt file
-        uline = list(filter(lambda line: line.startswith("# Units:"), lines))[0]
-        units = uline.split()[2:]
-        units = list(map(lambda s: re.sub(r"[{}]", "", s), units))
-    else:  # mumax3 txt file
-        uline = lines[0][2:].rstrip().split("\t")
-        units = list(map(lambda s: s.split()[1], uline))
-        units = list(map(lambda s: re.sub(r"[()]", "", s), units))
+    with open(filename, "rb") as f:
+        lines = _read_header(f)
 
-    return dict(zip(columns(filename, rename=rename), units))
+    return dict(zip(_columns(lines, rename=rename), _units(lines)))
 
 
 def data(filename):
@@ -306,12 +406,563 @@ def data(filename):
     [...]
 
     """
-    with open(filename) as f:
-        lines = f.readlines()
+    with open(filename, "rb") as f:
+        lines = _read_header(f)
+        values = _parse(f, ncols=len(_units(lines)))
+
+    return values.tolist()
+
+
+def read(
+    filename,
+    rename=True,
+    mmap=False,
+    usecols=None,
+    rows=None,
+    x=None,
+    x_range=None,
+    dtype=None,
+):
+    """Reads column names, units and numerical data from a table file.
+
+    The file is opened and read only once. Header lines are processed in
+    Python, whereas numerical data is parsed by ``numpy.loadtxt`` directly
+    into a ``float64`` array. Using this function is significantly faster than
+    calling ``columns``, ``units`` and ``data`` separately.
+
+    If ``mmap=True``, the file is memory-mapped instead. Data lines are first
+    located and counted without reading them into Python objects, the result
+    array is preallocated and blocks of lines are parsed into it one by one.
+    Peak memory usage therefore stays close to the size of the resulting
+    array, which is useful for very large files.
+
+    If ``usecols`` is passed, only the selected columns are converted to
+    floating point numbers, which reduces both the parsing time and memory
+    for files with many columns. Columns can be selected by their renamed or
+    original names.
+
+    Similarly, ``rows`` and ``x_range`` select a subset of rows. Lines which
+    are not selected are skipped without being converted to floating point
+    numbers, so that e.g. a preview of every 100th row of a very long table
+    is read in a fraction of the full parsing time. For ``x_range``, only the
+    ``x`` column of all lines is converted in a first pass. If ``rows`` and
+    ``x_range`` are both passed, ``rows`` selects from the rows within
+    ``x_range``. When selecting rows, ``mmap`` is ignored.
+
+    By default, all columns are ``float64``. If ``dtype`` is passed (e.g.
+    ``np.float32`` to halve the memory), columns are converted to it, except
+    for the OOMMF counters in ``integer_columns`` (e.g. ``iteration``), which
+    are stored as integers of the same size (``int32`` for ``float32``) as long
+    as all their values are integers which fit into them. Numbers are always
+    parsed as ``float64`` first, so that counters are exact.
+
+    Parameters
+    ----------
+    filename : str
+
+        OOMMF ``.odt`` or mumax3 ``.txt`` file.
+
+    rename : bool
+
+        If ``rename=True``, the column names are renamed with their shorter
+        versions. Defaults to ``True``.
+
+    mmap : bool
+
+        If ``mmap=True``, the file is memory-mapped and parsed block by block
+        into a preallocated array. Defaults to ``False``.
+
+    usecols : list, optional
+
+        Names of columns to be read in the given order. If not specified, all
+        columns are read. Defaults to ``None``.
+
+    rows : slice, optional
+
+        Rows to be read, e.g. ``slice(1000, None, 10)`` reads every 10th row
+        starting from the 1000th. Negative ``start`` and ``stop`` are
+        supported, negative ``step`` is not. If not specified, all rows are
+        read. Defaults to ``None``.
+
+    x : str, optional
+
+        Name of the column used for selecting rows with ``x_range``. Defaults
+        to ``None``.
+
+    x_range : tuple, optional
+
+        Length-2 tuple ``(xmin, xmax)``. Only rows with ``xmin <= x <= xmax``
+        are read. Either bound can be ``None``. Defaults to ``None``.
+
+    dtype : numpy.dtype, optional
+
+        Floating point data type of columns. If not specified, ``float64`` is
+        used for all columns, including counters. Defaults to ``None``.
+
+    Returns
+    -------
+    tuple
+
+        Length-2 tuple of ``pandas.DataFrame`` with numerical data and a
+        dictionary of column names and units.
+
+    Examples
+    --------
+    1. Reading an OOMMF ``.odt`` file.
+
+    >>> import os
+    >>> import ubermagtable.util as uu
+    ...
+    >>> odtfile = os.path.join(os.path.dirname(__file__), '..',
+    ...                        'tests', 'test_sample', 'oommf-old-file1.odt')
+    >>> data, units = uu.read(odtfile)
+    >>> data.shape
+    (25, 18)
+    >>> units['t']
+    's'
+
+    2. Reading a memory-mapped mumax3 ``.txt`` file.
+
+    >>> odtfile = os.path.join(os.path.dirname(__file__), '..',
+    ...                        'tests', 'test_sample', 'mumax3-file1.txt')
+    >>> data, units = uu.read(odtfile, mmap=True)
+    >>> data.shape
+    (10, 11)
+
+    3. Reading only selected columns.
+
+    >>> data, units = uu.read(odtfile, usecols=['t', 'mx', 'my', 'mz'])
+    >>> data.columns.to_list()
+    ['t', 'mx', 'my', 'mz']
+
+    4. Reading every other row with ``t`` between 0.3 and 0.8 ns.
+
+    >>> data, units = uu.read(odtfile, rows=slice(None, None, 2),
+    ...                       x='t', x_range=(3e-10, 8e-10))
+    >>> data['t'].to_list()
+    [3e-10, 5e-10, 7e-10]
+
+    5. Reading in single precision with integer counters.
+
+    >>> import numpy as np
+    ...
+    >>> odtfile = os.path.join(os.path.dirname(__file__), '..',
+    ...                        'tests', 'test_sample', 'oommf-old-file1.odt')
+    >>> data, units = uu.read(odtfile, dtype=np.float32)
+    >>> data['mx'].dtype, data['iteration'].dtype
+    (dtype('float32'), dtype('int32'))
+
+    """
+    if dtype is not None and not np.issubdtype(dtype, np.floating):
+        msg = f"Argument {dtype=} is not a floating point data type."
+        raise ValueError(msg)
+
+    with open(filename, "rb") as f:
+        lines = _read_header(f)
+        cols = _columns(lines, rename=rename)
+        names = _columns(lines, rename=True)  # for detecting counters
+        units = dict(zip(cols, _units(lines)))
+        if x_range is not None:
+            if x is None:
+                msg = "Column x must be passed to select rows using x_range."
+                raise ValueError(msg)
+            x = _column_indices(lines, cols, [x])[0]
+        if usecols is not None:
+            usecols = _column_indices(lines, cols, usecols)
+            cols = [cols[i] for i in usecols]
+            names = [names[i] for i in usecols]
+            units = {col: units[col] for col in cols}
+
+        if rows is not None or x_range is not None:
+            values = _parse_rows(f, len(cols), usecols, rows, x, x_range)
+        else:
+            parse = _parse_mmap if mmap else _parse
+            values = parse(f, ncols=len(cols), usecols=usecols)
+
+    if dtype is None:
+        return pd.DataFrame(values, columns=cols, copy=False), units
+
+    # Columns are labelled by their positions first to allow duplicated names.
+    data = pd.DataFrame(values.astype(dtype, copy=False), copy=False)
+    integer = np.dtype(f"int{max(np.dtype(dtype).itemsize, 4) * 8}")
+    for i, name in enumerate(names):
+        if name in integer_columns and _isinteger(values[:, i], integer):
+            data[i] = values[:, i].astype(integer)
+    data.columns = cols
+
+    return data, units
+
+
+def read_chunks(filename, chunksize, rename=True):
+    """Reads a table file in chunks of consecutive lines.
+
+    This is a generator which reads the header only once and then yields the
+    numerical data of at most ``chunksize`` lines at a time, so that files
+    larger than the available memory can be processed. Comment lines (e.g.
+    ``# Table End``) are skipped, but count towards ``chunksize``. The index
+    of each ``pandas.DataFrame`` continues from the previous chunk.
+
+    Parameters
+    ----------
+    filename : str
+
+        OOMMF ``.odt`` or mumax3 ``.txt`` file.
+
+    chunksize : int
+
+        Number of lines in a chunk.
+
+    rename : bool
+
+        If ``rename=True``, the column names are renamed with their shorter
+        versions. Defaults to ``True``.
+
+    Yields
+    ------
+    tuple
+
+        Length-2 tuple of ``pandas.DataFrame`` with numerical data and a
+        dictionary of column names and units.
+
+    Examples
+    --------
+    1. Reading an OOMMF ``.odt`` file in chunks of 10 lines.
+
+    >>> import os
+    >>> import ubermagtable.util as uu
+    ...
+    >>> odtfile = os.path.join(os.path.dirname(__file__), '..',
+    ...                        'tests', 'test_sample', 'oommf-old-file1.odt')
+    >>> [data.shape for data, _ in uu.read_chunks(odtfile, chunksize=10)]
+    [(10, 18), (10, 18), (5, 18)]
+
+    """
+    if chunksize < 1:
+        msg = f"Chunk size must be positive, not {chunksize=}."
+        raise ValueError(msg)
+
+    with open(filename, "rb") as f:
+        lines = _read_header(f)
+        cols = _columns(lines, rename=rename)
+        units = dict(zip(cols, _units(lines)))
+
+        start = 0
+        while chunk := list(itertools.islice(f, chunksize)):
+            values = _parse(chunk, ncols=len(cols))
+            if len(values) == 0:  # only comment lines, e.g. ``# Table End``
+                continue
+            index = pd.RangeIndex(start, start + len(values))
+            start += len(values)
+            yield pd.DataFrame(values, index=index, columns=cols, copy=False), units
+
+
+def cache_path(filename, directory=None, **kwargs):
+    """Path of the cached binary copy of a table file.
+
+    The name of the cached file is derived from the absolute path,
+    modification time and size of the table file, and the reading options
+    (e.g. ``rename`` or ``usecols``). Therefore, whenever the table file changes,
+    the cached copy is no longer found and becomes subject to eviction (see
+    ``evict_cache``).
+
+    If ``directory`` is not passed, the ``UBERMAGTABLE_CACHE_DIR`` environment
+    variable is used. If it is not set, cached tables are stored in
+    ``ubermagtable`` subdirectory of the user cache directory
+    (``$XDG_CACHE_HOME`` or ``~/.cache``).
+
+    Parameters
+    ----------
+    filename : str
+
+        OOMMF ``.odt`` or mumax3 ``.txt`` file.
+
+    directory : str, optional
+
+        Cache directory. Defaults to ``None``.
+
+    **kwargs
+
+        Options used for reading the table file (e.g. ``rename=False``).
+
+    Returns
+    -------
+    str
+
+        Path of the cached ``.npz`` file.
+
+    Examples
+    --------
+    1. Path of the cached table.
+
+    >>> import os
+    >>> import ubermagtable.util as uu
+    ...
+    >>> odtfile = os.path.join(os.path.dirname(__file__), '..',
+    ...                        'tests', 'test_sample', 'oommf-old-file1.odt')
+    >>> os.path.basename(uu.cache_path(odtfile))
+    'oommf-old-file1-....npz'
+
+    """
+    filename = os.path.abspath(filename)
+    stat = os.stat(filename)
+    key = f"{filename}:{stat.st_mtime_ns}:{stat.st_size}:{sorted(kwargs.items())}"
+    key = hashlib.sha1(key.encode()).hexdigest()
+    name = os.path.splitext(os.path.basename(filename))[0]
+
+    return os.path.join(_cache_directory(directory), f"{name}-{key}.npz")
+
+
+def evict_cache(maxsize=None, directory=None):
+    """Removes least recently used cached tables.
+
+    Cached tables are removed, starting from the least recently used one,
+    until their total size does not exceed ``maxsize``.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+
+        Maximum total size of cached tables in bytes. If not passed,
+        ``cache_maxsize`` is used. Defaults to ``None``.
+
+    directory : str, optional
+
+        Cache directory. If not passed, the default cache directory is used
+        (see ``cache_path``). Defaults to ``None``.
+
+    Examples
+    --------
+    1. Removing all cached tables from a directory.
+
+    >>> import ubermagtable.util as uu
+    ...
+    >>> uu.evict_cache(0, directory='nonexistent-cache-directory')
+
+    """
+    if maxsize is None:
+        maxsize = cache_maxsize
+    try:
+        entries = [
+            e
+            for e in os.scandir(_cache_directory(directory))
+            if e.name.endswith(".npz")
+        ]
+    except FileNotFoundError:
+        return
+
+    entries = sorted(
+        ((e.stat().st_mtime, e.stat().st_size, e.path) for e in entries),
+        reverse=True,  # most recently used first
+    )
+    total = 0
+    for _, size, path in entries:
+        total += size
+        if total > maxsize:
+            os.remove(path)
+
+
+def _cache_directory(directory=None):
+    """Default cache directory, unless ``directory`` is passed."""
+    if directory is None:
+        directory = os.environ.get("UBERMAGTABLE_CACHE_DIR")
+    if directory is None:
+        directory = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+        directory = os.path.join(directory, "ubermagtable")
+
+    return directory
+
+
+def _read_header(f):
+    """Read header lines from a table file opened in binary mode.
+
+    After reading, the file position is set to the beginning of the first
+    data line.
+
+    """
+    lines = []
+    offset = f.tell()
+    while (line := f.readline()).startswith(b"#"):
+        lines.append(line.decode())
+        offset = f.tell()
+    f.seek(offset)
+
+    return lines
 
-    values = []
-    for line in lines:
-        if not line.startswith("#"):
-            values.append(list(map(float, line.split())))
+
+def _columns(lines, rename=True):
+    """Column names from header lines."""
+    if lines[0].startswith("# ODT"):  # OOMMF odt file
+        cline = list(filter(lambda line: line.startswith("# Columns:"), lines))[0]
+        odt = True
+    else:  # mumax3 txt file
+        cline, odt = lines[0], False
+
+    return list(_parse_columns(cline, odt, rename, _renaming_state()))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_columns(cline, odt, rename, state):
+    """Column names from the header line.
+
+    Results are cached, because all files of a simulation series usually have
+    the same header. ``state`` of renaming rules is a part of the cache key, so
+    that changes of the rules are taken into account.
+
+    """
+    if odt:  # OOMMF odt file
+        cline = re.split("|".join(map(re.escape, oommf_prefixes)), cline)[1:]
+        cline = list(map(lambda col: re.sub(r"[{}]", "", col), cline))
+        cols = list(map(lambda s: s.strip(), cline))
+        cols_dict = oommf_dict
+    else:  # mumax3 txt file
+        cline = cline[2:].rstrip().split("\t")
+        cols = list(map(lambda s: s.split(" ")[0], cline))
+        cols_dict = mumax3_dict
+
+    if rename:
+        return tuple(rename_column(col, cols_dict) for col in cols)
+    else:
+        return tuple(cols)
+
+
+def _column_indices(lines, cols, names):
+    """Indices of columns given by their (renamed or original) names."""
+    renamed_cols = _columns(lines, rename=True)
+    original_cols = _columns(lines, rename=False)
+    indices = []
+    for name in names:
+        if name in cols:
+            indices.append(cols.index(name))
+        elif name in renamed_cols:
+            indices.append(renamed_cols.index(name))
+        elif name in original_cols:
+            indices.append(original_cols.index(name))
+        else:
+            msg = f"Column {name=} is not in the file."
+            raise ValueError(msg)
+
+    return indices
+
+
+def _units(lines):
+    """Units from header lines."""
+    if lines[0].startswith("# ODT"):  # OOMMF odt file
+        uline = list(filter(lambda line: line.startswith("# Units:"), lines))[0]
+        units = uline.split()[2:]
+        units = list(map(lambda s: re.sub(r"[{}]", "", s), units))
+    else:  # mumax3 txt file
+        uline = lines[0][2:].rstrip().split("\t")
+        units = list(map(lambda s: s.split()[1], uline))
+        units = list(map(lambda s: re.sub(r"[()]", "", s), units))
+
+    return units
+
+
+def _parse(f, ncols, usecols=None):
+    """Parse numerical data into a two-dimensional ``float64`` array.
+
+    Lines starting with ``#`` (e.g. ``# Table End``) are skipped. If
+    ``usecols`` is passed, only columns with these indices are converted and
+    ``ncols`` must be equal to their number.
+
+    """
+    with warnings.catch_warnings():
+        # numpy warns if there are no data lines in the file
+        warnings.simplefilter("ignore", UserWarning)
+        values = np.loadtxt(f, dtype=np.float64, comments="#", usecols=usecols, ndmin=2)
+
+    if values.size == 0:
+        values = values.reshape(0, ncols)
 
     return values
+
+
+def _parse_mmap(f, ncols, usecols=None):
+    """Parse numerical data of a memory-mapped file into a preallocated array.
+
+    The file is split into blocks of approximately ``mmap_blocksize`` bytes
+    ending at line boundaries. In the first pass, the number of data lines is
+    counted directly on the mapped memory. In the second pass, blocks are
+    parsed one at a time and copied into the preallocated array.
+
+    """
+    offset = f.tell()
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        bounds = [offset]
+        nrows = 0
+        while bounds[-1] < size:
+            start = bounds[-1]
+            end = mm.find(b"\n", min(start + mmap_blocksize, size))
+            end = size if end == -1 else end + 1
+            block = np.frombuffer(mm, dtype=np.uint8, count=end - start, offset=start)
+            # First characters of all lines in the block.
+            first = block[np.flatnonzero(block[:-1] == ord("\n")) + 1]
+            first = np.concatenate([block[:1], first])
+            nrows += np.count_nonzero(~np.isin(first, list(b"#\r\n")))
+            del block  # release the buffer so that the map can be closed
+            bounds.append(end)
+
+        values = np.empty((nrows, ncols), dtype=np.float64)
+        n = 0
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            block = _parse(io.BytesIO(mm[start:end]), ncols=ncols, usecols=usecols)
+            values[n : n + len(block)] = block
+            n += len(block)
+
+    # Whitespace-only lines are counted, but not parsed.
+    return values[:n]
+
+
+def _parse_rows(f, ncols, usecols, rows, x, x_range):
+    """Parse selected rows into a two-dimensional ``float64`` array.
+
+    ``x`` is the index of the column used for selecting rows with
+    ``x_range``. Data lines which are not selected are skipped without being
+    converted.
+
+    """
+    offset = f.tell()
+    lines = itertools.filterfalse(_skip_line, f)
+    nrows = None
+
+    if x_range is not None:
+        xvalues = _parse(f, ncols=1, usecols=[x])[:, 0]
+        f.seek(offset)
+        xmin, xmax = x_range
+        mask = np.ones_like(xvalues, dtype=bool)
+        if xmin is not None:
+            mask &= xvalues >= xmin
+        if xmax is not None:
+            mask &= xvalues <= xmax
+        lines = itertools.compress(lines, mask)
+        nrows = np.count_nonzero(mask)
+
+    if rows is not None:
+        if rows.step is not None and rows.step < 1:
+            msg = f"Step of {rows=} must be positive."
+            raise ValueError(msg)
+        start, stop, step = rows.start, rows.stop, rows.step
+        if any(i is not None and i < 0 for i in (start, stop)):
+            if nrows is None:
+                nrows = sum(1 for _ in itertools.filterfalse(_skip_line, f))
+                f.seek(offset)
+            start, stop, step = rows.indices(nrows)
+        lines = itertools.islice(lines, start, stop, step)
+
+    return _parse(lines, ncols=ncols, usecols=usecols)
+
+
+def _isinteger(values, dtype):
+    """Whether all ``values`` are integers which can be stored as ``dtype``."""
+    info = np.iinfo(dtype)
+    return bool(
+        np.all(np.mod(values, 1) == 0)
+        and np.all(values >= info.min)
+        and np.all(values <= info.max)
+    )
+
+
+def _skip_line(line):
+    """Whether a line does not contain data."""
+    return line.startswith(b"#") or line.isspace()